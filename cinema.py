@@ -7,9 +7,13 @@ My Local Cinema — Movies + Shows + Standup + Documentary
 - Local playback via VLC (or default player)
 """
 
-import os, re, json, time, argparse, urllib.parse, urllib.request, urllib.error, subprocess, shutil, math
-from http.server import HTTPServer, SimpleHTTPRequestHandler
-from functools import partial
+import os, re, io, json, time, argparse, urllib.parse, urllib.request, subprocess, shutil, math, threading, zlib, gzip, base64, email.utils
+import http.client
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+from functools import partial, lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from collections import defaultdict
+from heapq import nlargest
 
 # ====== DEFAULT ROOTS ======
 DEFAULT_MOVIES_ROOT  = "/Users/icemuppet/OTHER/SCN/MOVIES"
@@ -23,7 +27,9 @@ ARCHIVED_DIR_NAME = "0-ARCHIVED"
 EXCLUDED_DIRS     = {OUTPUT_DIR_NAME}
 PREFER_VLC        = True
 CACHE_POSTERS     = True
+CACHE_FLUSH_EVERY = 200   # items between TMDB cache checkpoints
 VIDEO_EXTS        = {".mkv",".mp4",".mov",".m4v",".avi",".wmv",".ts",".m2ts",".webm"}
+VIDEO_SUFFIXES    = tuple(sorted(VIDEO_EXTS))
 
 # Logging
 LOG_TMDB = True
@@ -45,7 +51,39 @@ TMDB_IMG_BASE     = "https://image.tmdb.org/t/p"
 POSTER_SIZE       = "w342"
 BACKDROP_SIZE     = "w1280"
 
+# TMDB concurrency (TMDB allows ~50 req/s; stay a little under)
+TMDB_WORKERS      = 16
+TMDB_RATE_PER_SEC = 40
+HTTP_RETRIES      = 3           # retries for dropped connections / 429 / 5xx
+HTTP_MAX_REDIRECTS = 5          # redirects followed per request (separate from the retries)
+DOWNLOAD_CHUNK    = 256 * 1024  # read size for poster downloads
+POSTER_WORKERS    = 32          # parallel poster downloads (image.tmdb.org, not rate limited)
+TMDB_MISS_TTL     = 7 * 86400   # seconds before a cached "no match" is searched again
+REFRESH_MISSES    = False       # --refresh-misses: ignore cached "no match" entries
+
 # ====== UTIL ======
+class RateLimiter:
+    """Token bucket shared by all TMDB worker threads."""
+    def __init__(self, rate: float):
+        self.rate = float(rate)
+        self.tokens = self.rate
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+_TMDB_LIMITER = RateLimiter(TMDB_RATE_PER_SEC)
+
 def _tmdb_url(base, params):
     params = dict(params)
     params.setdefault("language", "en-US")
@@ -57,51 +95,208 @@ def _tmdb_url(base, params):
     else:
         return base + "?" + urllib.parse.urlencode(params)  # still build, but will 401
 
+# Keep-alive connections, one per (thread, host): TLS handshakes are paid once per worker, not per request.
+_HTTP_LOCAL = threading.local()
+_RETRY_STATUS = {429, 500, 502, 503, 504}
+
+def _proxy_for(scheme: str, host: str):
+    # HTTP(S)_PROXY / NO_PROXY (and system settings), as urllib would apply them
+    proxy = urllib.request.getproxies().get(scheme)
+    if not proxy or urllib.request.proxy_bypass(host): return None
+    return urllib.parse.urlsplit(proxy if "://" in proxy else "http://" + proxy)
+
+def _new_conn(scheme: str, host: str, timeout: float):
+    """Connection for scheme://host: direct, https tunnelled through the proxy (CONNECT), or plain http sent to the proxy."""
+    cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+    proxy = _proxy_for(scheme, host)
+    if proxy is None:
+        conn = cls(host, timeout=timeout)
+        conn.via_proxy, conn.proxy_headers = False, {}
+        return conn
+    auth = {}
+    if proxy.username:
+        cred = f"{urllib.parse.unquote(proxy.username)}:{urllib.parse.unquote(proxy.password or '')}"
+        auth["Proxy-Authorization"] = "Basic " + base64.b64encode(cred.encode()).decode()
+    port = proxy.port or (443 if proxy.scheme == "https" else 80)
+    if scheme == "https":
+        conn = cls(proxy.hostname, port, timeout=timeout)
+        conn.set_tunnel(host, headers=auth)
+        conn.via_proxy, conn.proxy_headers = False, {}   # requests go through the tunnel as if direct
+    else:
+        conn = cls(proxy.hostname, port, timeout=timeout)
+        conn.via_proxy, conn.proxy_headers = True, auth
+    return conn
+
+def _http_conn(scheme: str, host: str, timeout: float):
+    conns = getattr(_HTTP_LOCAL, "conns", None)
+    if conns is None:
+        conns = _HTTP_LOCAL.conns = {}
+    conn = conns.get((scheme, host))
+    if conn is None:
+        conn = conns[(scheme, host)] = _new_conn(scheme, host, timeout)
+    return conn
+
+def http_get(url: str, headers: dict | None = None, timeout: float = 15):
+    """
+    GET url over this thread's pooled connection and return the http.client response.
+    The caller must read the body to the end before the connection can be reused.
+    Follows up to HTTP_MAX_REDIRECTS redirects and, separately, retries dropped connections / 429 / 5xx with backoff.
+    Proxies from the environment are honored.
+    """
+    attempt = redirects = 0
+    while True:
+        u = urllib.parse.urlsplit(url)
+        conn = _http_conn(u.scheme, u.netloc, timeout)
+        target = urllib.parse.urlunsplit(u._replace(fragment="")) if conn.via_proxy else \
+                 (u.path or "/") + (f"?{u.query}" if u.query else "")
+        try:
+            conn.request("GET", target, headers={**conn.proxy_headers, **(headers or {})})
+            r = conn.getresponse()
+        except (http.client.HTTPException, OSError):
+            conn.close()  # stale keep-alive socket; reconnects on the next request
+            if attempt == HTTP_RETRIES: raise
+            attempt += 1
+            continue
+        if r.status in (301, 302, 303, 307, 308) and r.getheader("Location") and redirects < HTTP_MAX_REDIRECTS:
+            r.read()
+            url = urllib.parse.urljoin(url, r.getheader("Location"))
+            redirects += 1
+            continue
+        if r.status in _RETRY_STATUS and attempt < HTTP_RETRIES:
+            r.read()
+            time.sleep(0.2 * (2 ** attempt))
+            attempt += 1
+            continue
+        return r
+
 def _tmdb_open(url):
+    _TMDB_LIMITER.acquire()
     try:
-        if TMDB_BEARER_TOKEN:
-            req = urllib.request.Request(url, headers={"Authorization": f"Bearer {TMDB_BEARER_TOKEN}"})
-        else:
-            req = urllib.request.Request(url)
-        with urllib.request.urlopen(req, timeout=15) as r:
-            data = r.read().decode("utf-8")
-            return json.loads(data)
-    except urllib.error.HTTPError as e:
-        body = ""
-        try: body = e.read().decode("utf-8", "ignore")
-        except Exception: pass
-        log("HTTPError", e.code, url, body[:200])
-        return None
+        headers = {"Authorization": f"Bearer {TMDB_BEARER_TOKEN}"} if TMDB_BEARER_TOKEN else {}
+        r = http_get(url, headers, timeout=15)
+        data = r.read()
+        if r.status >= 300:   # errors, and a redirect chain longer than HTTP_MAX_REDIRECTS
+            log("HTTPError", r.status, url, data.decode("utf-8", "ignore")[:200])
+            return None
+        return json.loads(data.decode("utf-8"))
     except Exception as e:
         log("OPEN ERROR", url, repr(e))
         return None
 
+@lru_cache(maxsize=8192)
 def html_text(s: str) -> str:
+    # memoized: titles, genres and cast names repeat across every page that shows them
     return (s or "").replace("&","&amp;").replace("<","&lt;").replace(">","&gt;").replace('"',"&quot;").replace("'","&#39;")
 
-def html_attr(s: str) -> str:
-    return html_text(s)
+html_attr = html_text   # attributes are always double-quoted, so the same escaping applies
+
+PLACEHOLDER_RE = re.compile(r"__([A-Z][A-Z0-9]*(?:_[A-Z0-9]+)*)__")
 
-def safe_size(path: str) -> int:
+@lru_cache(maxsize=32)
+def _template_parts(tpl: str) -> list:
+    # split once per template: [literal, name, literal, name, ..., literal]
+    return PLACEHOLDER_RE.split(tpl)
+
+def fill_template(tpl: str, values: dict) -> str:
+    """Substitute every __TOKEN__ (values keyed without the underscores); unknown markers are kept."""
+    parts = _template_parts(tpl)
+    if len(parts) == 1: return tpl   # no markers: nothing to fill
+    out = parts[:]
+    out[1::2] = [values.get(name, f"__{name}__") for name in parts[1::2]]
+    return "".join(out)
+
+@lru_cache(maxsize=2048)
+def html_list(items: tuple) -> str:
+    """Escaped ", "-joined names (genres, cast), or an em dash when empty."""
+    return ", ".join(map(html_text, items)) if items else "—"
+
+def safe_stat(entry: os.DirEntry):
+    try: return entry.stat()
+    except Exception: return None
+
+def safe_size(path: str, st: os.stat_result | None = None) -> int:
+    if st is not None: return st.st_size
     try: return os.path.getsize(path)
     except Exception: return 0
 
-def safe_mtime(path: str) -> float:
+def safe_mtime(path: str, st: os.stat_result | None = None) -> float:
+    if st is not None: return st.st_mtime
     try: return os.path.getmtime(path)
     except Exception: return 0.0
 
-def folder_size(root: str, exclude_names: set[str] | None = None) -> int:
+def is_video_name(name: str) -> bool:
+    # endswith(tuple) is a single C-level check; only mixed/upper-case names pay for .lower()
+    return name.endswith(VIDEO_SUFFIXES) or name.lower().endswith(VIDEO_SUFFIXES)
+
+def sorted_scandir(path: str) -> list[os.DirEntry]:
+    with os.scandir(path) as it:
+        return sorted(it, key=lambda e: e.name)
+
+def _sum_sizes(root: str, exclude_names=frozenset(), split_name: str | None = None) -> list[int]:
+    """One walk of root -> [bytes outside root/split_name, bytes inside it]. Hidden entries and excluded folders are skipped; symlinks are not followed."""
+    totals = [0, 0]
+    stack = [(root, 0, True)]
+    while stack:
+        d, bucket, top = stack.pop()
+        try:
+            with os.scandir(d) as it:
+                for e in it:
+                    name = e.name
+                    if name[:1] == ".": continue
+                    if e.is_dir(follow_symlinks=False):
+                        if name in exclude_names: continue   # excluded names prune folders only, as os.walk did
+                        stack.append((e.path, 1 if top and name == split_name else bucket, False))
+                    elif e.is_file(follow_symlinks=False):
+                        try: totals[bucket] += e.stat(follow_symlinks=False).st_size
+                        except OSError: pass
+        except OSError:
+            continue
+    return totals
+
+def _dir_signature(root: str, exclude_names=frozenset(), depth: int = 1) -> list:
+    """mtimes of root and its subfolders up to depth levels down: adding/removing a file in any of them changes one."""
+    sig = [os.stat(root).st_mtime]
+    stack = [(root, "", depth)]
+    while stack:
+        d, rel, left = stack.pop()
+        with os.scandir(d) as it:
+            for e in it:
+                if e.name[:1] == "." or e.name in exclude_names: continue
+                if e.is_dir(follow_symlinks=False):
+                    sub = rel + "/" + e.name if rel else e.name
+                    sig.append([sub, e.stat(follow_symlinks=False).st_mtime])
+                    if left > 1: stack.append((e.path, sub, left - 1))
+    sig[1:] = sorted(sig[1:])
+    return sig
+
+def _cached_walk(cache: dict | None, key: str, signature, walk):
+    """walk(), reusing cache[key] (persisted by the caller) while signature() is unchanged."""
+    if cache is None: return walk()
+    try: sig = signature()
+    except OSError: return walk()
+    hit = cache.get(key)
+    if hit and hit.get("sig") == sig: return hit["size"]
+    size = walk()
+    cache[key] = {"size": size, "sig": sig}
+    return size
+
+def folder_size(root: str, exclude_names: set[str] | None = None, cache: dict | None = None, depth: int = 1) -> int:
+    """Total bytes under root. With cache an unchanged tree is not re-walked; depth = how many folder levels hold files."""
     if not root or not os.path.isdir(root): return 0
-    exclude_names = exclude_names or set()
-    total = 0
-    for dirpath, dirnames, filenames in os.walk(root):
-        dirnames[:] = [d for d in dirnames if d not in exclude_names and not d.startswith(".")]
-        for fname in filenames:
-            if fname.startswith("."): continue
-            fp = os.path.join(dirpath, fname)
-            if os.path.islink(fp): continue
-            total += safe_size(fp)
-    return total
+    excl = frozenset(exclude_names or ())
+    return _cached_walk(cache, root + "|" + ",".join(sorted(excl)),
+                        lambda: _dir_signature(root, excl, depth), lambda: _sum_sizes(root, excl)[0])
+
+def category_sizes(root: str, cache: dict | None = None) -> tuple[int, int]:
+    """(active, archived) bytes of a movie-like root from a single walk; archived is everything under ARCHIVED_DIR_NAME."""
+    if not root or not os.path.isdir(root): return 0, 0
+    excl = frozenset({OUTPUT_DIR_NAME})
+    arch = os.path.join(root, ARCHIVED_DIR_NAME)
+    def signature():
+        return [_dir_signature(root, excl), _dir_signature(arch, excl) if os.path.isdir(arch) else None]
+    active, archived = _cached_walk(cache, root + "|split:" + ARCHIVED_DIR_NAME, signature,
+                                    lambda: _sum_sizes(root, excl, split_name=ARCHIVED_DIR_NAME))
+    return active, archived
 
 def format_size_lower(nbytes: int) -> str:
     units = [("tb", 1024**4), ("gb", 1024**3), ("mb", 1024**2), ("kb", 1024)]
@@ -111,57 +306,74 @@ def format_size_lower(nbytes: int) -> str:
             return f"{int(round(val))}{name}" if val >= 10 else f"{val:.1f}{name}"
     return "0b"
 
+# ====== REGEXES ======
+# Compiled once at import; the title parsers run for every file in the library.
+WS_RE                = re.compile(r"\s+")
+FOLDER_SEP_RE        = re.compile(r"[.\s()\[\]{}_+]+")   # any run of separators/brackets -> one space
+NAME_SEP_RE          = re.compile(r"[._\s()\[\]{}]+")
+NONWORD_RE           = re.compile(r"[^\w\s]")
+NONWORD_COLON_RE     = re.compile(r"[^\w\s:]")
+DOTS_UNDERSCORE_RE   = re.compile(r"[._]+")
+ARTICLE_RE           = re.compile(r"^(the|a|an)\s+")
+YEAR_TOKEN_RE        = re.compile(r"\b(19\d{2}|20\d{2})\b")
+TRAILING_YEAR_RE     = re.compile(r"\b(19\d{2}|20\d{2})\b\s*$")
+TRAILING_SEP_YEAR_RE = re.compile(r"[.\s]*\b(19\d{2}|20\d{2})\b\s*$")
+PAREN_YEAR_RE        = re.compile(r"\s*\(\d{4}\)\s*$")
+
 # ====== MOVIE-LIKE DISCOVERY (Movies/Standup/Documentary) ======
 YEAR_RE = re.compile(r"(19\d{2}|20\d{2})")
 
 def parse_title_year_from_folder(name: str):
-    s = name.replace(".", " ")
-    s = re.sub(r"[()\[\]{}_+]+", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
+    s = FOLDER_SEP_RE.sub(" ", name).strip()
     m = YEAR_RE.search(s)
     if not m: return (s, None)
-    year = int(m.group(1))
-    title = s[:m.start()].strip()
-    title = re.sub(r"\s+", " ", title)
-    return (title, year)
+    return (s[:m.start()].strip(), int(m.group(1)))
 
-def find_video_in_folder(folder_path: str):
-    best, best_size = None, -1
+def _find_video_entry(folder_path: str):
+    """Largest video directly inside folder_path as (DirEntry, stat_result), or (None, None)."""
+    best, best_st, best_size = None, None, -1
     try:
-        for root, _, files in os.walk(folder_path):
-            for f in files:
-                _, ext = os.path.splitext(f)
-                if ext.lower() in VIDEO_EXTS:
-                    fp = os.path.join(root, f)
-                    size = safe_size(fp)
+        with os.scandir(folder_path) as it:  # only top level
+            for e in it:
+                if is_video_name(e.name) and e.is_file():
+                    st = safe_stat(e)
+                    size = safe_size(e.path, st)
                     if size > best_size:
-                        best, best_size = fp, size
-            break  # only top level
+                        best, best_st, best_size = e, st, size
     except Exception:
         pass
-    return best
+    return best, best_st
+
+def find_video_in_folder(folder_path: str):
+    best, _ = _find_video_entry(folder_path)
+    return best.path if best else None
 
 def discover_video_pool(root: str, base_dir: str, archived: bool, start_id: int, skip_archived_folder_in_root=False, id_prefix="m"):
+    # size/mtime come from the stat taken during the scan, so later steps never re-stat the video
     items, i = [], start_id
     if not os.path.isdir(base_dir): return items, i
-    for entry in sorted(os.listdir(base_dir)):
+    for de in sorted_scandir(base_dir):
+        entry = de.name
         if entry.startswith(".") or entry in EXCLUDED_DIRS: continue
         if skip_archived_folder_in_root and entry == ARCHIVED_DIR_NAME: continue
-        p = os.path.join(base_dir, entry)
-        if os.path.isdir(p):
+        p = de.path
+        if de.is_dir():
             title, year = parse_title_year_from_folder(entry)
-            vid = find_video_in_folder(p)
+            vid_entry, vid_st = _find_video_entry(p)
+            vid = vid_entry.path if vid_entry else None
             rel = os.path.relpath(vid, root) if vid else ""
             items.append({"id": f"{id_prefix}{i}", "title": title, "year": year, "abs_path": vid or "", "rel_path": rel,
-                          "source": entry, "archived": archived, "mtime": safe_mtime(vid or "")})
+                          "source": entry, "archived": archived, "mtime": safe_mtime(vid or "", vid_st),
+                          "size": safe_size(vid, vid_st) if vid else 0})
             i += 1
-        elif os.path.isfile(p):
-            base, ext = os.path.splitext(entry)
-            if ext.lower() not in VIDEO_EXTS: continue
+        elif de.is_file():
+            if not is_video_name(entry): continue
+            base, _ = os.path.splitext(entry)
             title, year = parse_title_year_from_folder(base)
             rel = os.path.relpath(p, root)
+            st = safe_stat(de)
             items.append({"id": f"{id_prefix}{i}", "title": title, "year": year, "abs_path": p, "rel_path": rel,
-                          "source": entry, "archived": archived, "mtime": safe_mtime(p)})
+                          "source": entry, "archived": archived, "mtime": safe_mtime(p, st), "size": safe_size(p, st)})
             i += 1
     return items, i
 
@@ -177,10 +389,7 @@ SxxEyy_RE = re.compile(r"\b[Ss]\s*(\d{1,2})\s*[.\-_ ]*[Ee]\s*(\d{1,2})\b")
 QUALITY_SET = {"2160P","1080P","720P","480P"}
 
 def clean_name(s: str) -> str:
-    s = s.replace("_"," ").replace(".", " ")
-    s = re.sub(r"[()\[\]{}]+", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
+    return NAME_SEP_RE.sub(" ", s).strip()
 
 def parse_show_from_string(text: str):
     s = clean_name(text)
@@ -189,7 +398,7 @@ def parse_show_from_string(text: str):
     season = int(m.group(1)); episode = int(m.group(2))
     show_name = s[:m.start()].strip()
     tail = s[m.end():].strip()
-    tokens = [t for t in re.split(r"\s+", tail) if t]
+    tokens = tail.split(" ") if tail else []   # clean_name already collapsed whitespace
     ep_title_tokens = []
     for t in tokens:
         if t.upper() in QUALITY_SET:
@@ -198,33 +407,43 @@ def parse_show_from_string(text: str):
     ep_title = " ".join(ep_title_tokens).strip()
     return {"show": show_name, "season": season, "episode": episode, "ep_title": ep_title}
 
-def _add_or_update_episode(meta_for_show: dict, season: int, epnum: int, title: str, file_path: str):
+def _add_or_update_episode(meta_for_show: dict, season: int, epnum: int, title: str, file_path: str,
+                           st: os.stat_result | None = None, by_ep: dict | None = None):
+    # by_ep: optional {(season, epnum): episode} index for this show, so duplicates are found without scanning the season
     season_key = str(season)
     meta_for_show["seasons"].setdefault(season_key, [])
     lst = meta_for_show["seasons"][season_key]
-    size = safe_size(file_path)
-    mtime = safe_mtime(file_path)
-    for item in lst:
-        if item["e"] == epnum:
-            if size > item.get("size", 0):
-                item["file"] = file_path
-                item["size"] = size
-                item["mtime"] = mtime
-            if not item.get("title") and title:
-                item["title"] = title
-            return
-    lst.append({"eid": None, "s": season, "e": epnum, "title": title, "file": file_path, "size": size, "mtime": mtime})
+    size = safe_size(file_path, st)
+    mtime = safe_mtime(file_path, st)
+    if by_ep is not None:
+        item = by_ep.get((season, epnum))
+    else:
+        item = next((x for x in lst if x["e"] == epnum), None)
+    if item is not None:
+        if size > item.get("size", 0):
+            item["file"] = file_path
+            item["size"] = size
+            item["mtime"] = mtime
+        if not item.get("title") and title:
+            item["title"] = title
+        return
+    item = {"eid": None, "s": season, "e": epnum, "title": title, "file": file_path, "size": size, "mtime": mtime}
+    lst.append(item)
+    if by_ep is not None:
+        by_ep[(season, epnum)] = item
 
 def discover_shows(shows_root: str):
     shows_meta = {}
     shows_map = {}
+    ep_lookup = {}   # sid -> {(season, episode): episode dict}
     show_id_seq = 1
     if not os.path.isdir(shows_root):
         return [], {}, {}
 
-    def handle_file(fp, fname):
+    def handle_file(de):
         nonlocal show_id_seq
-        if not (os.path.isfile(fp) and os.path.splitext(fname)[1].lower() in VIDEO_EXTS):
+        fp, fname = de.path, de.name
+        if not (is_video_name(fname) and de.is_file()):
             return
         parsed = parse_show_from_string(fname)
         if not parsed: return
@@ -241,16 +460,16 @@ def discover_shows(shows_root: str):
                 "seasons": {}
             }
         sid = shows_map[key]
-        _add_or_update_episode(shows_meta[sid], parsed["season"], parsed["episode"], parsed["ep_title"], fp)
+        _add_or_update_episode(shows_meta[sid], parsed["season"], parsed["episode"], parsed["ep_title"], fp,
+                               safe_stat(de), ep_lookup.setdefault(sid, {}))
 
-    for entry in sorted(os.listdir(shows_root)):
-        if entry.startswith(".") or entry in EXCLUDED_DIRS: continue
-        p = os.path.join(shows_root, entry)
-        if os.path.isdir(p):
-            for f in sorted(os.listdir(p)):
-                handle_file(os.path.join(p, f), f)
-        elif os.path.isfile(p):
-            handle_file(p, entry)
+    for de in sorted_scandir(shows_root):
+        if de.name.startswith(".") or de.name in EXCLUDED_DIRS: continue
+        if de.is_dir():
+            for f in sorted_scandir(de.path):
+                handle_file(f)
+        elif de.is_file():
+            handle_file(de)
 
     # sort episodes and assign EIDs; build index
     episodes_index = {}
@@ -281,73 +500,190 @@ def minutes_to_hm(m):
     h = m // 60; mm = m % 60
     return f"{h}h {mm}m" if h else f"{mm}m"
 
-def load_cache(path): 
+def json_compact(obj) -> str:
+    # one-shot C encoder: no indent, no padding spaces (json.dump / indent= fall back to the pure-Python encoder)
+    return json.dumps(obj, ensure_ascii=False, separators=(",",":"))
+
+def load_cache(path):
     if os.path.isfile(path):
         try:
-            with open(path,"r",encoding="utf-8") as f: return json.load(f)
-        except Exception: pass
+            # one bulk read; json.loads sniffs the UTF-8 bytes itself
+            with open(path,"rb") as f: return json.loads(f.read())
+        except (OSError, ValueError) as e:
+            print(f"[CACHE] ignoring unreadable {path}: {e!r}")
     return {}
 
 def save_cache(path, obj):
+    # write-then-rename so an interrupted build never leaves a truncated cache
+    tmp = path + ".tmp"
     try:
-        with open(path,"w",encoding="utf-8") as f: json.dump(obj,f,ensure_ascii=False,indent=2)
-    except Exception: pass
+        data = json_compact(obj).encode("utf-8")
+        with open(tmp,"wb") as f: f.write(data)
+        os.replace(tmp, path)
+    except OSError as e:
+        # disk full / read-only site dir: keep the previous cache file, drop the partial one
+        print(f"[CACHE] could not write {path}: {e!r}")
+        try: os.remove(tmp)
+        except OSError: pass
+
+def write_if_changed(path: str, data: bytes) -> bool:
+    """Write data unless the file already holds exactly it (keeps mtime, so browsers' cached copies stay valid)."""
+    try:
+        if os.path.getsize(path) == len(data):
+            with open(path, "rb") as f:
+                if f.read() == data: return False
+    except OSError:
+        pass
+    with open(path, "wb") as f: f.write(data)
+    return True
+
+def write_with_gzip(path: str, data: bytes) -> bool:
+    """write_if_changed plus a path.gz sibling (level 9: compressed once per build, served on every load)."""
+    changed = write_if_changed(path, data)
+    try: stale = changed or os.path.getmtime(path + ".gz") < os.path.getmtime(path)
+    except OSError: stale = True   # no .gz yet
+    if stale:
+        # always rewritten with its source, so it is never older than it (serve_gzip treats an older .gz as stale)
+        with open(path + ".gz", "wb") as f: f.write(gzip.compress(data, compresslevel=9, mtime=0))
+    return changed
+
+def accepts_gzip(header: str) -> bool:
+    for part in (header or "").lower().split(","):
+        name, _, params = part.partition(";")
+        if name.strip() in ("gzip", "*"):
+            params = params.strip()
+            try: return not params.startswith("q=") or float(params[2:]) > 0
+            except ValueError: return False
+    return False
+
+def asset_version(data: bytes) -> str:
+    # appended as ?v= to static/data URLs: a rebuild with new content gets a new URL, unchanged files stay cached
+    return format(zlib.crc32(data), "08x")
 
 def download_file(url: str, dest_path: str) -> bool:
     try:
         os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-        with urllib.request.urlopen(url, timeout=20) as r, open(dest_path,"wb") as out:
-            shutil.copyfileobj(r, out)
+        r = http_get(url, timeout=20)
+        if r.status != 200:
+            r.read()
+            log("POSTER DOWNLOAD FAIL", url, f"HTTP {r.status}")
+            return False
+        # big reads: a poster arrives in one or two chunks; .part + rename so a failed download never looks cached
+        part = dest_path + ".part"
+        with open(part,"wb") as out:
+            shutil.copyfileobj(r, out, length=DOWNLOAD_CHUNK)
+        os.replace(part, dest_path)
         return True
     except Exception as e:
         log("POSTER DOWNLOAD FAIL", url, repr(e))
         return False
 
+def poster_local_path(site_dir: str, subdir: str, poster_url: str, fallback_id: str) -> str:
+    basename = os.path.basename(urllib.parse.urlparse(poster_url).path)
+    return os.path.join(site_dir, subdir, basename or f"{fallback_id}.jpg")
+
+def cache_posters(jobs: dict) -> set:
+    """Download {local_path: url} in parallel; returns the set of local paths that are on disk afterwards."""
+    todo = {local: url for local, url in jobs.items() if not os.path.isfile(local)}
+    ok = set(jobs) - set(todo)
+    if todo:
+        with ThreadPoolExecutor(max_workers=POSTER_WORKERS) as ex:
+            for local, good in zip(todo, ex.map(lambda local: download_file(todo[local], local), todo)):
+                if good: ok.add(local)
+    return ok
+
 # ---------- Matching / scoring ----------
+@lru_cache(maxsize=4096)
 def _norm_title(t: str) -> str:
     t = (t or "").lower()
-    t = re.sub(r"[^\w\s]", " ", t)
-    t = re.sub(r"\s+", " ", t).strip()
+    t = NONWORD_RE.sub(" ", t)
+    t = WS_RE.sub(" ", t).strip()
     # harmless article drop for better matches
-    t = re.sub(r"^(the|a|an)\s+", "", t)
+    t = ARTICLE_RE.sub("", t)
     return t
 
-def _token_set(t: str) -> set:
-    return set(_norm_title(t).split())
+@lru_cache(maxsize=4096)
+def _token_set(t: str) -> frozenset:
+    return frozenset(_norm_title(t).split())
+
+YEAR_SCORES = {0: 0.25, 1: 0.18, 2: 0.1}   # |query year - candidate year| -> bonus; anything further is -0.1
+POSTER_BONUS = 0.05
+COLON_BONUS  = 0.08
 
 def _year_score(query_year, cand_year):
     try:
         if not query_year or not cand_year: return 0.0
-        diff = abs(int(query_year) - int(cand_year))
-        if diff == 0: return 0.25
-        if diff <= 1: return 0.18
-        if diff == 2: return 0.1
-        return -0.1
+        return YEAR_SCORES.get(abs(int(query_year) - int(cand_year)), -0.1)
     except Exception:
         return 0.0
 
-def _sim_score(qtitle: str, ctitle: str, qyear: int|None, cyear: int|None, has_poster: bool):
-    qs, cs = _token_set(qtitle), _token_set(ctitle)
+@lru_cache(maxsize=4096)
+def _query_key(qtitle: str):
+    """(token set, colon-free normalized title): the per-title scoring inputs, cached for queries and candidates alike."""
+    return _token_set(qtitle), _norm_title(qtitle).replace(":", "")
+
+def _sim_score(query: tuple, ctitle: str, qyear: int|None, cyear: int|None, has_poster: bool):
+    qs, qn = query
+    cs, cn = _query_key(ctitle)
+    # Jaccard on cached frozensets; |A ∪ B| = |A| + |B| - |A ∩ B| saves building the union set
     inter = len(qs & cs)
-    union = max(1, len(qs | cs))
+    union = max(1, len(qs) + len(cs) - inter)
     jacc = inter / union
     y = _year_score(qyear, cyear)
-    poster_bonus = 0.05 if has_poster else 0.0
+    poster_bonus = POSTER_BONUS if has_poster else 0.0
     # bonus if one is colon-variant of the other (standup specials)
-    colon_bonus = 0.08 if _norm_title(qtitle).replace(":", "") in _norm_title(ctitle).replace(":", "") or \
-                           _norm_title(ctitle).replace(":", "") in _norm_title(qtitle).replace(":", "") else 0.0
+    colon_bonus = COLON_BONUS if qn in cn or cn in qn else 0.0
     return jacc + y + poster_bonus + colon_bonus
 
+def _max_score(query_year) -> float:
+    # what _sim_score returns for an exact title/year match with a poster; nothing later in the results can beat it
+    return 1.0 + (YEAR_SCORES[0] if query_year else 0.0) + POSTER_BONUS + COLON_BONUS
+
+def _cache_title_key(title: str) -> str:
+    # "The.Matrix" / "Matrix" share one cache entry (and one TMDB lookup)
+    return _norm_title(title) or (title or "").lower()
+
+def _is_recent_miss(c: dict) -> bool:
+    return bool(c.get("not_found")) and not REFRESH_MISSES and time.time() - c.get("checked_at", 0) < TMDB_MISS_TTL
+
+MOVIE_DETAIL_FIELDS = ("genres", "runtime", "vote", "certification", "cast")
+SHOW_DETAIL_FIELDS  = ("genres", "vote", "first_year", "cast")
+
+def _is_current(c: dict, mtime, id_key: str, required: tuple) -> bool:
+    # Looked up for this exact file already: optional fields TMDB left blank (tagline, backdrop) aren't re-fetched every build.
+    # A missing poster or overview is retried every build, as before the mtime check existed.
+    return (bool(mtime) and c.get("mtime") == mtime and bool(c.get(id_key)) and bool(c.get("poster_url"))
+            and bool(c.get("overview")) and all(c.get(k) not in (None, []) for k in required))
+
+def _poster_on_disk(site_dir: str, subdir: str, c: dict, item_id: str) -> bool:
+    # with CACHE_POSTERS a current entry also needs its local copy; otherwise the lookup runs again
+    return not CACHE_POSTERS or os.path.isfile(poster_local_path(site_dir, subdir, c["poster_url"], item_id))
+
+class _TmdbUnknown:
+    # falsy like "no data", but tells a search TMDB never answered (no creds / request failed) from "no results"
+    def __bool__(self): return False
+    def __repr__(self): return "TMDB_UNKNOWN"
+
+TMDB_UNKNOWN = _TmdbUnknown()
+
+def _mark_miss(entry: dict, found: bool, answered: bool) -> dict:
+    # only a real answer with no usable match is cached as a miss; an unanswered search is retried next build
+    if not found and answered:
+        entry["not_found"] = True
+        entry["checked_at"] = time.time()
+    return entry
+
 # ====== MOVIE ENRICHMENT (Movies/Standup/Documentary) ======
 def tmdb_search_movie(title: str, year: int | None):
     if not (TMDB_BEARER_TOKEN or TMDB_API_KEY):
         log("NO TMDB CREDS; cannot search movie:", title, year)
-        return None
+        return TMDB_UNKNOWN
     params = {"query": title, "include_adult": "false", "page": 1}
     if year: params["year"] = str(year)
     url = _tmdb_url(TMDB_SEARCH_MOVIE, params)
     log("SEARCH MOVIE", {"title": title, "year": year, "url": url})
-    return _tmdb_open(url)
+    data = _tmdb_open(url)
+    return TMDB_UNKNOWN if data is None else data
 
 def tmdb_movie_details(mid: int):
     if not (TMDB_BEARER_TOKEN or TMDB_API_KEY): return None
@@ -370,146 +706,184 @@ def _pick_best_movie(result_json, query_title, query_year):
     results = result_json.get("results") or []
     log("MOVIE RESULTS", len(results))
     best, best_score = None, -1
+    query, ceiling = _query_key(query_title), _max_score(query_year)
     for r in results[:10]:
         cand_title = r.get("title") or r.get("original_title") or ""
         release_date = r.get("release_date") or ""
         cyear = int(release_date[:4]) if release_date[:4].isdigit() else None
         poster = bool(r.get("poster_path"))
-        sc = _sim_score(query_title, cand_title, query_year, cyear, poster)
+        sc = _sim_score(query, cand_title, query_year, cyear, poster)
         log("  cand:", cand_title, cyear, "score:", f"{sc:.3f}", "poster:", poster)
         if sc > best_score:
             best_score = sc
             best = r
+            if sc >= ceiling: break
     if best:
         log("PICKED MOVIE:", best.get("title"), best.get("id"), f"score={best_score:.3f}")
     return best
 
+def try_search_variants(title, year, force_yearless=False):
+    """
+    Movies: try (year, year±1..±2) then yearless.
+    Standup/Docs (force_yearless=True): ALWAYS yearless searches and strip any year tokens from the text.
+    Also try a colon variant (common for stand-up specials).
+    Returns (best_result_dict, used_title); with no match best is None, or TMDB_UNKNOWN if any search went unanswered.
+    """
+    # Base title (strip any standalone year tokens when forcing yearless)
+    t_base = title
+    if force_yearless:
+        t_base = YEAR_TOKEN_RE.sub("", t_base)
+        t_base = WS_RE.sub(" ", t_base).strip()
+
+    # Build text variants (never append a year to the query string itself)
+    variants = [
+        t_base,
+        DOTS_UNDERSCORE_RE.sub(" ", t_base),
+        NONWORD_COLON_RE.sub(" ", t_base).strip(),  # keep ':' if present
+    ]
+
+    # ADD COLON VARIANT **ONLY** FOR STANDUP/DOCS
+    if force_yearless and ":" not in t_base:
+        words = WS_RE.sub(" ", t_base).split()
+        if len(words) >= 2:
+            if len(words) == 2:
+                variants.append(f"{words[0]}: {words[1]}")
+            else:
+                variants.append(f"{words[0]} {words[1]}: {' '.join(words[2:])}")
+
+
+    seen = set()
+    unanswered = False
+    def attempt(qtitle, y):
+        nonlocal unanswered
+        key = (qtitle or "").lower() + "|" + str(y)
+        if not qtitle or key in seen:
+            return None
+        seen.add(key)
+        # Force yearless for standup/docs
+        use_year = None if force_yearless else y
+        data = tmdb_search_movie(qtitle, use_year)
+        if data is TMDB_UNKNOWN: unanswered = True
+        if data and (data.get("results") or []):
+            best = _pick_best_movie(data, qtitle, use_year)
+            if best:
+                return (best, qtitle)
+        return None
+
+    # Standup/Docs: ONLY yearless attempts
+    if force_yearless:
+        for t in variants:
+            res = attempt(t, None)
+            if res: return res
+        # extra fallback: remove colon and collapse spaces
+        t0 = WS_RE.sub(" ", variants[0].replace(":", " ")).strip()
+        return attempt(t0, None) or (TMDB_UNKNOWN if unanswered else None, None)
+
+    # Movies: year sweep, then yearless
+    year_sweep = [year, year-1, year+1, year-2, year+2] if year else []
+    for y in year_sweep:
+        for t in variants:
+            res = attempt(t, y)
+            if res: return res
+    for t in variants:
+        res = attempt(t, None)
+        if res: return res
+    t0 = WS_RE.sub(" ", variants[0].replace(":", " ")).strip()
+    return attempt(t0, None) or (TMDB_UNKNOWN if unanswered else None, None)
+
+def _lookup_movie(item, c):
+    """Network half of enrich_movies: returns the refreshed cache entry for one item (runs on a worker thread)."""
+    if _is_recent_miss(c):
+        return c
+    poster_url = c.get("poster_url","")
+    overview   = c.get("overview","")
+    movie_id   = c.get("movie_id")
+    genres     = c.get("genres")
+    runtime    = c.get("runtime")
+    vote       = c.get("vote")
+    cert       = c.get("certification")
+    cast       = c.get("cast")
+    backdrop   = c.get("backdrop_url","")
+    tagline    = c.get("tagline","")
+
+    need_details = not (genres and runtime is not None and vote is not None and cert is not None and cast)
+
+    answered = True
+    if not movie_id or need_details or not poster_url or not overview:
+        best, used_title = try_search_variants(item["title"], item["year"])
+        answered = best is not TMDB_UNKNOWN
+        if best:
+            movie_id = best.get("id") or movie_id
+            pp = best.get("poster_path"); poster_url = f"{TMDB_IMG_BASE}/{POSTER_SIZE}{pp}" if pp else poster_url
+            overview = (best.get("overview") or overview or "").strip()
+        else:
+            log("NO MOVIE MATCH", item["title"], item["year"])
+
+    if movie_id and (need_details or not backdrop or not tagline):
+        det = tmdb_movie_details(movie_id)
+        if det:
+            genres  = genres or [g.get("name") for g in (det.get("genres") or []) if g.get("name")]
+            runtime = det.get("runtime") if runtime is None else runtime
+            vote    = det.get("vote_average") if vote is None else vote
+            tagline = (det.get("tagline") or tagline or "").strip()
+            bp = det.get("backdrop_path"); backdrop = f"{TMDB_IMG_BASE}/{BACKDROP_SIZE}{bp}" if bp and not backdrop else backdrop
+            cert = cert or extract_cert_from_movie_release_dates(det.get("release_dates") or {})
+            if not cast:
+                cast = [c.get("name") for c in (det.get("credits", {}).get("cast", []) or []) if c.get("name")]
+                cast = cast[:5] if cast else []
+        else:
+            log("NO MOVIE DETAILS", movie_id)
+
+    return _mark_miss({"movie_id": movie_id, "poster_url": poster_url, "overview": overview,
+                       "genres": genres or [], "runtime": runtime, "vote": vote, "certification": cert,
+                       "cast": cast or [], "backdrop_url": backdrop or "", "tagline": tagline or ""}, bool(movie_id), answered)
+
 def enrich_movies(items, site_dir: str):
     cache_path = os.path.join(site_dir, "tmdb_movie_cache.json")
     cache = load_cache(cache_path)
-    enriched = []
-    for item in items:
-        key = f"{item['title']}|{item['year']}"
-        c = cache.get(key, {}) or {}
-        poster_url = c.get("poster_url","")
-        overview   = c.get("overview","")
-        movie_id   = c.get("movie_id")
-        genres     = c.get("genres")
-        runtime    = c.get("runtime")
-        vote       = c.get("vote")
-        cert       = c.get("certification")
-        cast       = c.get("cast")
-        backdrop   = c.get("backdrop_url","")
-        tagline    = c.get("tagline","")
-
-        need_details = not (genres and runtime is not None and vote is not None and cert is not None and cast)
-        
-        def try_search_variants(title, year, force_yearless=False):
-            """
-            Movies: try (year, year±1..±2) then yearless.
-            Standup/Docs (force_yearless=True): ALWAYS yearless searches and strip any year tokens from the text.
-            Also try a colon variant (common for stand-up specials).
-            Returns (best_result_dict, used_title) or (None, None).
-            """
-            # Base title (strip any standalone year tokens when forcing yearless)
-            t_base = title
-            if force_yearless:
-                t_base = re.sub(r"\b(19\d{2}|20\d{2})\b", "", t_base)
-                t_base = re.sub(r"\s+", " ", t_base).strip()
-
-            # Build text variants (never append a year to the query string itself)
-            variants = [
-                t_base,
-                re.sub(r"[._]+", " ", t_base),
-                re.sub(r"[^\w\s:]", " ", t_base).strip(),  # keep ':' if present
-            ]
-
-            # ADD COLON VARIANT **ONLY** FOR STANDUP/DOCS
-            if force_yearless and ":" not in t_base:
-                words = re.sub(r"\s+", " ", t_base).split()
-                if len(words) >= 2:
-                    if len(words) == 2:
-                        variants.append(f"{words[0]}: {words[1]}")
-                    else:
-                        variants.append(f"{words[0]} {words[1]}: {' '.join(words[2:])}")
-
-
-            seen = set()
-            def attempt(qtitle, y):
-                key = (qtitle or "").lower() + "|" + str(y)
-                if not qtitle or key in seen:
-                    return None
-                seen.add(key)
-                # Force yearless for standup/docs
-                use_year = None if force_yearless else y
-                data = tmdb_search_movie(qtitle, use_year)
-                if data and (data.get("results") or []):
-                    best = _pick_best_movie(data, qtitle, use_year)
-                    if best:
-                        return (best, qtitle)
-                return None
-
-            # Standup/Docs: ONLY yearless attempts
-            if force_yearless:
-                for t in variants:
-                    res = attempt(t, None)
-                    if res: return res
-                # extra fallback: remove colon and collapse spaces
-                t0 = re.sub(":", " ", variants[0]); t0 = re.sub(r"\s+"," ", t0).strip()
-                return attempt(t0, None) or (None, None)
-
-            # Movies: year sweep, then yearless
-            year_sweep = [year, year-1, year+1, year-2, year+2] if year else []
-            for y in year_sweep:
-                for t in variants:
-                    res = attempt(t, y)
-                    if res: return res
-            for t in variants:
-                res = attempt(t, None)
-                if res: return res
-            t0 = re.sub(":", " ", variants[0]); t0 = re.sub(r"\s+"," ", t0).strip()
-            return attempt(t0, None) or (None, None)
-
-
-
-        if not movie_id or need_details or not poster_url or not overview:
-            best, used_title = try_search_variants(item["title"], item["year"])
-            if best:
-                movie_id = best.get("id") or movie_id
-                pp = best.get("poster_path"); poster_url = f"{TMDB_IMG_BASE}/{POSTER_SIZE}{pp}" if pp else poster_url
-                overview = (best.get("overview") or overview or "").strip()
-            else:
-                log("NO MOVIE MATCH", item["title"], item["year"])
-
-        if movie_id and (need_details or not backdrop or not tagline):
-            det = tmdb_movie_details(movie_id)
-            if det:
-                genres  = genres or [g.get("name") for g in (det.get("genres") or []) if g.get("name")]
-                runtime = det.get("runtime") if runtime is None else runtime
-                vote    = det.get("vote_average") if vote is None else vote
-                tagline = (det.get("tagline") or tagline or "").strip()
-                bp = det.get("backdrop_path"); backdrop = f"{TMDB_IMG_BASE}/{BACKDROP_SIZE}{bp}" if bp and not backdrop else backdrop
-                cert = cert or extract_cert_from_movie_release_dates(det.get("release_dates") or {})
-                if not cast:
-                    cast = [c.get("name") for c in (det.get("credits", {}).get("cast", []) or []) if c.get("name")]
-                    cast = cast[:5] if cast else []
-            else:
-                log("NO MOVIE DETAILS", movie_id)
+    keys = [f"{_cache_title_key(item['title'])}|{item['year']}" for item in items]
+
+    # One lookup per distinct key; entries stored under the old raw "title|year" key are carried over
+    todo = {}
+    for item, key in zip(items, keys):
+        if key in todo: continue
+        todo[key] = item
+        legacy = f"{item['title']}|{item['year']}"
+        if key not in cache and legacy in cache:
+            cache[key] = cache.pop(legacy)
+
+    # Unchanged files keep their entry; the rest are pure I/O: fan them out, then apply results (cache, posters) on this thread
+    entries, stale = {}, []
+    for key, item in todo.items():
+        c = cache.get(key) or {}
+        if _is_current(c, item.get("mtime"), "movie_id", MOVIE_DETAIL_FIELDS) and \
+           _poster_on_disk(site_dir, "posters", c, item["id"]): entries[key] = c
+        else: stale.append(key)
+    with ThreadPoolExecutor(max_workers=TMDB_WORKERS) as ex:
+        results = ex.map(lambda key: _lookup_movie(todo[key], cache.get(key, {}) or {}), stale)
+        for i, (key, entry) in enumerate(zip(stale, results), 1):
+            entry["mtime"] = todo[key].get("mtime")
+            entries[key] = cache[key] = entry
+            # checkpoint while lookups are still in flight, so a crash/Ctrl-C keeps finished work
+            if i % CACHE_FLUSH_EVERY == 0: save_cache(cache_path, cache)
+
+    # Posters: collect every local target first, then download the missing ones in one parallel pass
+    locals_by_id, jobs = {}, {}
+    if CACHE_POSTERS:
+        for item, key in zip(items, keys):
+            url = entries[key]["poster_url"]
+            if url:
+                local = locals_by_id[item["id"]] = poster_local_path(site_dir, "posters", url, item["id"])
+                jobs[local] = url
+    on_disk = cache_posters(jobs)
 
-        cache[key] = {"movie_id": movie_id, "poster_url": poster_url, "overview": overview,
-                      "genres": genres or [], "runtime": runtime, "vote": vote, "certification": cert,
-                      "cast": cast or [], "backdrop_url": backdrop or "", "tagline": tagline or ""}
-        save_cache(cache_path, cache)
+    enriched = []
+    for item, key in zip(items, keys):
+        entry = cache[key] = entries[key]
+        poster_url = entry["poster_url"]
 
-        local_poster = ""
-        if CACHE_POSTERS and poster_url:
-            posters_dir = os.path.join(site_dir, "posters")
-            basename = os.path.basename(urllib.parse.urlparse(poster_url).path)
-            local = os.path.join(posters_dir, basename or f"{item['id']}.jpg")
-            if not os.path.isfile(local):
-                if download_file(poster_url, local): local_poster = "posters/" + os.path.basename(local)
-            else:
-                local_poster = "posters/" + os.path.basename(local)
+        local = locals_by_id.get(item["id"])
+        local_poster = "posters/" + os.path.basename(local) if local in on_disk else ""
 
         e = dict(item)
         e["poster_url"] = local_poster if local_poster else poster_url
@@ -522,30 +896,31 @@ def enrich_movies(items, site_dir: str):
         e["backdrop_url"] = cache[key]["backdrop_url"]
         e["tagline"]    = cache[key]["tagline"]
         enriched.append(e)
-        time.sleep(0.12)
+    if items: save_cache(cache_path, cache)
     return enriched
 
 # ====== TV ENRICHMENT ======
 def normalize_title_for_search(t: str) -> str:
     t = t.replace(".", " ").replace("_", " ")
-    t = re.sub(r"\s*\(\d{4}\)\s*$","", t)
-    t = re.sub(r"\b(19\d{2}|20\d{2})\b\s*$","", t)
-    t = re.sub(r"[^\w\s]", " ", t)
-    t = re.sub(r"\s+"," ", t).strip()
+    t = PAREN_YEAR_RE.sub("", t)
+    t = TRAILING_YEAR_RE.sub("", t)
+    t = NONWORD_RE.sub(" ", t)
+    t = WS_RE.sub(" ", t).strip()
     return t
 
 def strip_trailing_year(title: str) -> str:
-    t = re.sub(r"[.\s]*\b(19\d{2}|20\d{2})\b\s*$", "", title).strip()
+    t = TRAILING_SEP_YEAR_RE.sub("", title).strip()
     return t
 
 def tmdb_search_tv(title: str):
     if not (TMDB_BEARER_TOKEN or TMDB_API_KEY):
         log("NO TMDB CREDS; cannot search tv:", title)
-        return None
+        return TMDB_UNKNOWN
     params = {"query": title, "include_adult": "false", "page": 1}
     url = _tmdb_url(TMDB_SEARCH_TV, params)
     log("SEARCH TV", {"title": title, "url": url})
-    return _tmdb_open(url)
+    data = _tmdb_open(url)
+    return TMDB_UNKNOWN if data is None else data
 
 def tmdb_tv_details(tvid: int):
     if not (TMDB_BEARER_TOKEN or TMDB_API_KEY): return None
@@ -569,98 +944,134 @@ def _pick_best_tv(result_json, query_title):
     results = result_json.get("results") or []
     log("TV RESULTS", len(results))
     best, best_score = None, -1
+    query, ceiling = _query_key(query_title), _max_score(None)
     for r in results[:10]:
         cand_title = r.get("name") or r.get("original_name") or ""
         first_air = r.get("first_air_date") or ""
         cyear = int(first_air[:4]) if first_air[:4].isdigit() else None
         poster = bool(r.get("poster_path"))
-        sc = _sim_score(query_title, cand_title, None, cyear, poster)
+        sc = _sim_score(query, cand_title, None, cyear, poster)
         log("  cand:", cand_title, cyear, "score:", f"{sc:.3f}", "poster:", poster)
         if sc > best_score:
             best_score = sc
             best = r
+            if sc >= ceiling: break
     if best:
         log("PICKED TV:", best.get("name"), best.get("id"), f"score={best_score:.3f}")
     return best
 
-def enrich_shows(shows_list, shows_meta, site_dir: str):
-    cache_path = os.path.join(site_dir, "tmdb_tv_cache.json")
-    cache = load_cache(cache_path)
-
-    for show in shows_list:
-        title = show["title"]
-        key = title.lower()
-        c = cache.get(key, {}) or {}
-        poster_url = c.get("poster_url","")
-        overview   = c.get("overview","")
-        tv_id      = c.get("tv_id")
-        genres     = c.get("genres")
-        vote       = c.get("vote")
-        first_year = c.get("first_year")
-        cast       = c.get("cast")
-        backdrop   = c.get("backdrop_url","")
-        tagline    = c.get("tagline","")
-
-        need_details = not (genres and vote is not None and first_year is not None and cast)
-
-        def try_tv_variants(title_in):
-            variants = [
-                title_in,
-                strip_trailing_year(title_in),
-                normalize_title_for_search(title_in),
-                normalize_title_for_search(strip_trailing_year(title_in)),
-            ]
-            seen=set()
-            for t in variants:
-                t=t.strip()
-                if not t or t.lower() in seen: continue
-                seen.add(t.lower())
-                data = tmdb_search_tv(t)
-                if data and (data.get("results") or []):
-                    best = _pick_best_tv(data, t)
-                    if best:
-                        return (best, t)
-            return (None, None)
-
-        if not tv_id or need_details or not poster_url or not overview:
-            best, used_title = try_tv_variants(title)
+def try_tv_variants(title_in):
+    variants = [
+        title_in,
+        strip_trailing_year(title_in),
+        normalize_title_for_search(title_in),
+        normalize_title_for_search(strip_trailing_year(title_in)),
+    ]
+    seen=set(); unanswered=False
+    for t in variants:
+        t=t.strip()
+        if not t or t.lower() in seen: continue
+        seen.add(t.lower())
+        data = tmdb_search_tv(t)
+        if data is TMDB_UNKNOWN: unanswered = True
+        if data and (data.get("results") or []):
+            best = _pick_best_tv(data, t)
             if best:
-                tv_id = best.get("id") or tv_id
-                pp = best.get("poster_path");  poster_url = f"{TMDB_IMG_BASE}/{POSTER_SIZE}{pp}" if pp else poster_url
-                overview = (best.get("overview") or overview or "").strip()
-                first_year = first_air_year_from(best.get("first_air_date"))
-            else:
-                log("NO TV MATCH", title)
-
-        if tv_id and (need_details or not backdrop or not tagline):
-            det = tmdb_tv_details(tv_id)
-            if det:
-                genres  = genres or [g.get("name") for g in (det.get("genres") or []) if g.get("name")]
-                vote    = det.get("vote_average") if vote is None else vote
-                tagline = (det.get("tagline") or tagline or "").strip()
-                bp = det.get("backdrop_path"); backdrop = f"{TMDB_IMG_BASE}/{BACKDROP_SIZE}{bp}" if bp and not backdrop else backdrop
-                if not first_year:
-                    first_year = first_air_year_from(det.get("first_air_date"))
-                if not cast:
-                    cast = [c.get("name") for c in (det.get("credits", {}).get("cast", []) or []) if c.get("name")]
-                    cast = cast[:5] if cast else []
-            else:
-                log("NO TV DETAILS", tv_id)
+                return (best, t)
+    return (TMDB_UNKNOWN if unanswered else None, None)
+
+def _lookup_show(title, c):
+    """Network half of enrich_shows: returns the refreshed cache entry for one show (runs on a worker thread)."""
+    if _is_recent_miss(c):
+        return c
+    poster_url = c.get("poster_url","")
+    overview   = c.get("overview","")
+    tv_id      = c.get("tv_id")
+    genres     = c.get("genres")
+    vote       = c.get("vote")
+    first_year = c.get("first_year")
+    cast       = c.get("cast")
+    backdrop   = c.get("backdrop_url","")
+    tagline    = c.get("tagline","")
+
+    need_details = not (genres and vote is not None and first_year is not None and cast)
+
+    answered = True
+    if not tv_id or need_details or not poster_url or not overview:
+        best, used_title = try_tv_variants(title)
+        answered = best is not TMDB_UNKNOWN
+        if best:
+            tv_id = best.get("id") or tv_id
+            pp = best.get("poster_path");  poster_url = f"{TMDB_IMG_BASE}/{POSTER_SIZE}{pp}" if pp else poster_url
+            overview = (best.get("overview") or overview or "").strip()
+            first_year = first_air_year_from(best.get("first_air_date"))
+        else:
+            log("NO TV MATCH", title)
+
+    if tv_id and (need_details or not backdrop or not tagline):
+        det = tmdb_tv_details(tv_id)
+        if det:
+            genres  = genres or [g.get("name") for g in (det.get("genres") or []) if g.get("name")]
+            vote    = det.get("vote_average") if vote is None else vote
+            tagline = (det.get("tagline") or tagline or "").strip()
+            bp = det.get("backdrop_path"); backdrop = f"{TMDB_IMG_BASE}/{BACKDROP_SIZE}{bp}" if bp and not backdrop else backdrop
+            if not first_year:
+                first_year = first_air_year_from(det.get("first_air_date"))
+            if not cast:
+                cast = [c.get("name") for c in (det.get("credits", {}).get("cast", []) or []) if c.get("name")]
+                cast = cast[:5] if cast else []
+        else:
+            log("NO TV DETAILS", tv_id)
 
-        cache[key] = {"tv_id": tv_id, "poster_url": poster_url, "overview": overview, "genres": genres or [],
-                      "vote": vote, "first_year": first_year, "cast": cast or [],
-                      "backdrop_url": backdrop or "", "tagline": tagline or ""}
-        save_cache(cache_path, cache)
+    return _mark_miss({"tv_id": tv_id, "poster_url": poster_url, "overview": overview, "genres": genres or [],
+                       "vote": vote, "first_year": first_year, "cast": cast or [],
+                       "backdrop_url": backdrop or "", "tagline": tagline or ""}, bool(tv_id), answered)
 
-        local_poster = ""
-        if CACHE_POSTERS and poster_url:
-            posters_dir = os.path.join(site_dir, "posters_tv")
-            basename = os.path.basename(urllib.parse.urlparse(poster_url).path)
-            local = os.path.join(posters_dir, basename or f"{show['id']}.jpg")
-            if not os.path.isfile(local):
-                if download_file(poster_url, local): local_poster = "posters_tv/" + os.path.basename(local)
-            else:
-                local_poster = "posters_tv/" + os.path.basename(local)
+def enrich_shows(shows_list, shows_meta, site_dir: str):
+    cache_path = os.path.join(site_dir, "tmdb_tv_cache.json")
+    cache = load_cache(cache_path)
+    keys = [_cache_title_key(show["title"]) for show in shows_list]
+
+    todo, mtimes, ids = {}, {}, {}
+    for show, key in zip(shows_list, keys):
+        if key in todo: continue
+        todo[key] = show["title"]
+        ids[key] = show["id"]
+        mtimes[key] = max((ep.get("mtime") or 0.0 for eps in shows_meta[show["id"]]["seasons"].values() for ep in eps), default=0.0)
+        legacy = show["title"].lower()
+        if key not in cache and legacy in cache:
+            cache[key] = cache.pop(legacy)
+
+    # Newest episode unchanged since the last lookup -> keep the entry
+    entries, stale = {}, []
+    for key in todo:
+        c = cache.get(key) or {}
+        if _is_current(c, mtimes[key], "tv_id", SHOW_DETAIL_FIELDS) and \
+           _poster_on_disk(site_dir, "posters_tv", c, ids[key]): entries[key] = c
+        else: stale.append(key)
+    with ThreadPoolExecutor(max_workers=TMDB_WORKERS) as ex:
+        results = ex.map(lambda key: _lookup_show(todo[key], cache.get(key, {}) or {}), stale)
+        for i, (key, entry) in enumerate(zip(stale, results), 1):
+            entry["mtime"] = mtimes[key]
+            entries[key] = cache[key] = entry
+            # checkpoint while lookups are still in flight, so a crash/Ctrl-C keeps finished work
+            if i % CACHE_FLUSH_EVERY == 0: save_cache(cache_path, cache)
+
+    locals_by_id, jobs = {}, {}
+    if CACHE_POSTERS:
+        for show, key in zip(shows_list, keys):
+            url = entries[key]["poster_url"]
+            if url:
+                local = locals_by_id[show["id"]] = poster_local_path(site_dir, "posters_tv", url, show["id"])
+                jobs[local] = url
+    on_disk = cache_posters(jobs)
+
+    for show, key in zip(shows_list, keys):
+        entry = cache[key] = entries[key]
+        poster_url = entry["poster_url"]
+
+        local = locals_by_id.get(show["id"])
+        local_poster = "posters_tv/" + os.path.basename(local) if local in on_disk else ""
 
         show["poster_url"] = local_poster if local_poster else poster_url
         show["overview"]   = cache[key]["overview"]
@@ -678,13 +1089,16 @@ def enrich_shows(shows_list, shows_meta, site_dir: str):
             "tagline":    cache[key]["tagline"],
             "tv_id":      cache[key]["tv_id"]
         })
-        time.sleep(0.12)
+    if shows_list: save_cache(cache_path, cache)
 
     return shows_list, shows_meta
 
 def fill_episode_titles_from_tmdb(shows_meta: dict, site_dir: str):
     cache_path = os.path.join(site_dir, "tmdb_tv_ep_cache.json")
     cache = load_cache(cache_path)
+
+    # Queue every (tv_id, season, ep) that still needs a title and is not cached yet
+    untitled, pending = [], {}
     for sid, meta in shows_meta.items():
         tv_id = meta.get("tv_id")
         if not tv_id:
@@ -695,83 +1109,246 @@ def fill_episode_titles_from_tmdb(shows_meta: dict, site_dir: str):
                 if ep.get("title"): continue
                 epnum = int(ep["e"])
                 ckey = f"{tv_id}|{season}|{epnum}"
-                name = cache.get(ckey)
-                if not name:
-                    det = tmdb_tv_episode_details(tv_id, season, epnum)
-                    name = (det or {}).get("name") or ""
-                    cache[ckey] = name
-                    save_cache(cache_path, cache)
-                    time.sleep(0.10)
-                if name:
-                    ep["title"] = name
+                untitled.append((ep, ckey))
+                if not cache.get(ckey):
+                    pending[ckey] = (tv_id, season, epnum)
+
+    if pending:
+        def fetch(args):
+            det = tmdb_tv_episode_details(*args)
+            return (det or {}).get("name") or ""
+        with ThreadPoolExecutor(max_workers=TMDB_WORKERS) as ex:
+            for ckey, name in zip(pending, ex.map(fetch, pending.values())):
+                cache[ckey] = name
+        save_cache(cache_path, cache)
+
+    for ep, ckey in untitled:
+        name = cache.get(ckey)
+        if name:
+            ep["title"] = name
     return shows_meta
 
 # ====== SHARED CSS/HEADER ======
+# All pages share one stylesheet, written to static/app.css by build_site and cached by the browser
+APP_CSS = """:root { --bg:#111; --fg:#eee; --muted:#bbb; --card:#1b1b1b; --card2:#222; --teal:#14b8a6; --gold:#f59e0b; }
+* { box-sizing:border-box; }
+html, body { margin:0; padding:0; background:var(--bg); color:var(--fg); font-family:'Roboto', -apple-system,BlinkMacSystemFont,"Segoe UI",Roboto,Helvetica,Arial,sans-serif; }
+header { position:sticky; top:0; z-index:10; background:linear-gradient(180deg, rgba(0,0,0,.85), rgba(0,0,0,.6)); padding:16px 20px; backdrop-filter: blur(6px); }
+.topbar { display:flex; align-items:center; justify-content:space-between; gap:16px; }
+h1.brand, a.brand {
+  margin:0; font-size:30px; letter-spacing:.6px; line-height:1;
+  background: linear-gradient(90deg, #22d3ee, #14b8a6);
+  -webkit-background-clip: text; background-clip: text; -webkit-text-fill-color: transparent;
+  text-shadow: 0 2px 18px rgba(20,184,166,.25);
+  font-weight:900; text-decoration:none;
+}
+.tabs { display:flex; gap:10px; margin-left: 14px; }
+.tab { display:inline-flex; align-items:center; gap:8px; padding:8px 12px; border-radius:10px;
+       background: rgba(255,255,255,.06); color:#d4d4d4; text-decoration:none; border:1px solid #333;
+       font-weight:700; letter-spacing:.2px; }
+.tab.active { background: rgba(20,184,166,.18); color:#fff; border-color: rgba(20,184,166,.5); box-shadow: 0 0 0 2px rgba(20,184,166,.25); }
+.tab.gold { background: rgba(245,158,11,.12); border-color: rgba(245,158,11,.35); color:#fcd34d; }
+.tab.gold.active { background: rgba(245,158,11,.24); color:#fff; border-color: rgba(245,158,11,.55); box-shadow: 0 0 0 2px rgba(245,158,11,.35); }
+.rightstats { color:#9aa3ab; font-size:12px; letter-spacing:.3px; }
+.rightstats .size { color:#6b7280; opacity:.85; }
+.controls { display:flex; gap:12px; margin-top:10px; flex-wrap:wrap; align-items:center; }
+input[type="search"] { background:var(--card2); color:var(--fg); border:1px solid #333; padding:10px 12px; border-radius:10px; min-width:240px; }
+select { background:var(--card2); color:var(--fg); border:1px solid #333; padding:10px 12px; border-radius:10px; }
+main { padding: 18px 20px 60px; }
+.grid { display:grid; grid-template-columns: repeat(auto-fill, minmax(150px,1fr)); gap:14px; }
+a.card { text-decoration:none; color:inherit; display:flex; flex-direction:column; background: var(--card); border-radius: 14px; overflow: hidden; box-shadow: 0 4px 18px rgba(0,0,0,.35); transition: transform .15s ease, box-shadow .15s ease; position:relative; }
+a.card:hover {
+  transform: translateY(-2px);
+  box-shadow:
+    0 10px 26px rgba(0,0,0,.5),
+    0 0 0 3px rgba(20,184,166,.85),
+    0 18px 48px rgba(20,184,166,.45),
+    0 0 30px rgba(20,184,166,.36);
+}
+.poster-wrap { width:100%; aspect-ratio: 2/3; background:#0f0f0f; display:flex; align-items:center; justify-content:center; }
+.poster { width:100%; height:100%; object-fit:cover; display:block; }
+.meta { padding:10px 10px 12px; display:flex; flex-direction:column; gap:6px; }
+.title { font-weight:700; font-size:14px; line-height:1.25; }
+.sub { font-size:12px; color:var(--muted); }
+.overview { font-size:12px; color:var(--muted); white-space:pre-wrap; }
+.empty { color:#999; text-align:center; padding:40px 0; }
+footer { color:#666; text-align:center; padding:16px; font-size:12px; }
+.badge { display:inline-block; padding:2px 6px; border-radius:6px; font-size:10px; background:#1f3e74; color:#b9d6ff; margin-left:8px; vertical-align:middle; }
+.badge-new { background: linear-gradient(180deg, #f59e0b, #d97706); color:#111; border:1px solid rgba(245,158,11,.45); box-shadow: 0 6px 22px rgba(245,158,11,.15), 0 0 0 2px rgba(245,158,11,.15) inset; }
+.section-title { margin:18px 2px 10px; font-size:30px; font-weight:900; letter-spacing:.3px; color:#fcd34d;
+                 text-shadow: 0 0 18px rgba(245,158,11,.4), 0 4px 24px rgba(20,184,166,.25); }
+.divider.strong { height:3px; margin:28px 0 18px;
+                  background: linear-gradient(90deg, rgba(34,211,238,.6), rgba(20,184,166,.6), rgba(245,158,11,.45));
+                  box-shadow: 0 2px 18px rgba(20,184,166,.3), 0 0 22px rgba(245,158,11,.25); border-radius:2px; }
+
+.locked-poster { width:280px; height:420px; background:#0f0f0f; border-radius:14px; overflow:hidden; box-shadow: 0 6px 24px rgba(0,0,0,.45); align-self:start; }
+.locked-poster img { width:100%; height:100%; object-fit:cover; display:block; image-rendering:auto; }
+
+/* New page condensed shows list */
+ul.ep-list { list-style:none; padding:0; margin:8px 0 0; font-size:12px; color:#cbd5e1; }
+ul.ep-list li { padding:2px 0; white-space:nowrap; overflow:hidden; text-overflow:ellipsis; }
+ul.ep-list li.more { color:#9aa3ab; letter-spacing:.5px; }
+
+/* Movie / standup / documentary detail pages */
+body.detail {
+  min-height:100vh;
+  background:
+    linear-gradient(180deg, rgba(0,0,0,.75) 0%, rgba(0,0,0,.85) 40%, rgba(0,0,0,.95) 100%),
+    var(--backdrop) center / cover fixed no-repeat, #000;
+}
+body.detail main { padding:26px 20px 30px; max-width:1040px; margin:0 auto; }
+body.detail .wrap { display:grid; grid-template-columns: 280px 1fr; gap:22px; align-items:start; }
+body.detail h1 { margin:0 0 6px; font-size:32px; line-height:1.15; }
+body.detail .sub { color:var(--muted); margin-bottom:14px; font-size:14px; }
+body.detail .badge { display:inline-block; padding:2px 6px; border-radius:6px; font-size:10px; background:#1f3e74; color:#b9d6ff; margin-left:8px; vertical-align:middle; }
+body.detail .meta-row { display:flex; flex-wrap:wrap; gap:12px 18px; margin:8px 0 16px; font-size:14px; color:#ddd;}
+body.detail .chip { background:rgba(255,255,255,.08); border:1px solid #444; padding:6px 10px; border-radius:999px; }
+body.detail .section { margin-top:16px; }
+body.detail .label { font-size:12px; color:#aaa; margin-bottom:6px; }
+body.detail .cast { display:flex; flex-wrap:wrap; gap:8px; font-size:13px; color:#ddd; }
+body.detail .actions { margin-top:14px; display:flex; gap:10px; }
+body.detail .btn { display:inline-flex; align-items:center; gap:8px; padding:10px 14px; background:#fff; color:#000; text-decoration:none; border-radius:10px; font-weight:700; border:1px solid #ddd; }
+body.detail .icon { width:16px; height:16px; display:inline-block; }
+body.detail .fileinfo { margin-top:10px; background: rgba(20,184,166,.08); border:1px solid rgba(20,184,166,.35);
+            border-radius:12px; padding:10px 12px; box-shadow: 0 0 0 2px rgba(20,184,166,.15), 0 16px 36px rgba(20,184,166,.20);
+            display:flex; align-items:center; gap:10px; flex-wrap:wrap; }
+body.detail .fileinfo .fn { font-weight:700; }
+body.detail .fileinfo .fs { color:#9aa3ab; }
+
+/* Show pages */
+body.show-page { min-height:100vh;
+  background:
+    linear-gradient(180deg, rgba(0,0,0,.75) 0%, rgba(0,0,0,.85) 40%, rgba(0,0,0,.95) 100%),
+    var(--backdrop) center / cover fixed no-repeat, #000; }
+body.show-page main { padding:26px 20px 30px; max-width:1100px; margin:0 auto; }
+body.show-page .wrap { display:grid; grid-template-columns: 280px 1fr; gap:22px; align-items:start; }
+body.show-page h1 { margin:0 0 6px; font-size:32px; line-height:1.15; }
+body.show-page .sub { color:var(--muted); margin-bottom:14px; font-size:14px; }
+body.show-page .meta-row { display:flex; flex-wrap:wrap; gap:12px 18px; margin:8px 0 16px; font-size:14px; color:#ddd;}
+body.show-page .chip { background:rgba(255,255,255,.08); border:1px solid #444; padding:6px 10px; border-radius:999px; }
+body.show-page .section { margin-top:16px; }
+body.show-page .label { font-size:12px; color:#aaa; margin-bottom:6px; }
+body.show-page .cast { display:flex; flex-wrap:wrap; gap:8px; font-size:13px; color:#ddd; }
+body.show-page .season { margin-top:16px; background:rgba(255,255,255,.06); border:1px solid #333; border-radius:12px; padding:12px; }
+body.show-page .season h2 { margin:0 0 12px; font-size:18px; letter-spacing:.3px; }
+body.show-page .ep { display:flex; align-items:center; justify-content:space-between; gap:12px; padding:8px 10px; border-radius:10px; }
+body.show-page .ep:hover { background:rgba(20,184,166,.08); box-shadow: inset 0 0 0 1px rgba(20,184,166,.3); }
+body.show-page .ep .info { display:flex; gap:10px; align-items:center; flex-wrap:wrap; }
+body.show-page .btn { display:inline-flex; align-items:center; gap:8px; padding:8px 12px; background:#fff; color:#000; text-decoration:none; border-radius:10px; font-weight:700; border:1px solid #ddd; }
+body.show-page .icon { width:16px; height:16px; display:inline-block; }
+body.show-page .filesize { color:#9aa3ab; font-size:12px; }
+body.show-page .badge { display:inline-block; padding:2px 6px; border-radius:6px; font-size:10px; background:#1f3e74; color:#b9d6ff; vertical-align:middle; }
+body.show-page .badge-new { background: linear-gradient(180deg, #f59e0b, #d97706); color:#111; border:1px solid rgba(245,158,11,.45); box-shadow: 0 6px 22px rgba(245,158,11,.15), 0 0 0 2px rgba(245,158,11,.15) inset; margin-right:8px; }
+body.show-page .locked-poster { width:280px; height:420px; background:#0f0f0f; border-radius:14px; overflow:hidden; box-shadow: 0 6px 24px rgba(0,0,0,.45); align-self:start; }
+body.show-page .locked-poster img { width:100%; height:100%; object-fit:cover; display:block; image-rendering:auto; }
+"""
+
 HEADER_TOP = """
 <link href="https://fonts.googleapis.com/css2?family=Roboto:wght@400;700;900&display=swap" rel="stylesheet">
-<style>
-  :root { --bg:#111; --fg:#eee; --muted:#bbb; --card:#1b1b1b; --card2:#222; --teal:#14b8a6; --gold:#f59e0b; }
-  * { box-sizing:border-box; }
-  html, body { margin:0; padding:0; background:var(--bg); color:var(--fg); font-family:'Roboto', -apple-system,BlinkMacSystemFont,"Segoe UI",Roboto,Helvetica,Arial,sans-serif; }
-  header { position:sticky; top:0; z-index:10; background:linear-gradient(180deg, rgba(0,0,0,.85), rgba(0,0,0,.6)); padding:16px 20px; backdrop-filter: blur(6px); }
-  .topbar { display:flex; align-items:center; justify-content:space-between; gap:16px; }
-  h1.brand, a.brand {
-    margin:0; font-size:30px; letter-spacing:.6px; line-height:1;
-    background: linear-gradient(90deg, #22d3ee, #14b8a6);
-    -webkit-background-clip: text; background-clip: text; -webkit-text-fill-color: transparent;
-    text-shadow: 0 2px 18px rgba(20,184,166,.25);
-    font-weight:900; text-decoration:none;
-  }
-  .tabs { display:flex; gap:10px; margin-left: 14px; }
-  .tab { display:inline-flex; align-items:center; gap:8px; padding:8px 12px; border-radius:10px;
-         background: rgba(255,255,255,.06); color:#d4d4d4; text-decoration:none; border:1px solid #333;
-         font-weight:700; letter-spacing:.2px; }
-  .tab.active { background: rgba(20,184,166,.18); color:#fff; border-color: rgba(20,184,166,.5); box-shadow: 0 0 0 2px rgba(20,184,166,.25); }
-  .tab.gold { background: rgba(245,158,11,.12); border-color: rgba(245,158,11,.35); color:#fcd34d; }
-  .tab.gold.active { background: rgba(245,158,11,.24); color:#fff; border-color: rgba(245,158,11,.55); box-shadow: 0 0 0 2px rgba(245,158,11,.35); }
-  .rightstats { color:#9aa3ab; font-size:12px; letter-spacing:.3px; }
-  .rightstats .size { color:#6b7280; opacity:.85; }
-  .controls { display:flex; gap:12px; margin-top:10px; flex-wrap:wrap; align-items:center; }
-  input[type="search"] { background:var(--card2); color:var(--fg); border:1px solid #333; padding:10px 12px; border-radius:10px; min-width:240px; }
-  select { background:var(--card2); color:var(--fg); border:1px solid #333; padding:10px 12px; border-radius:10px; }
-  main { padding: 18px 20px 60px; }
-  .grid { display:grid; grid-template-columns: repeat(auto-fill, minmax(150px,1fr)); gap:14px; }
-  a.card { text-decoration:none; color:inherit; display:flex; flex-direction:column; background: var(--card); border-radius: 14px; overflow: hidden; box-shadow: 0 4px 18px rgba(0,0,0,.35); transition: transform .15s ease, box-shadow .15s ease; position:relative; }
-  a.card:hover {
-    transform: translateY(-2px);
-    box-shadow:
-      0 10px 26px rgba(0,0,0,.5),
-      0 0 0 3px rgba(20,184,166,.85),
-      0 18px 48px rgba(20,184,166,.45),
-      0 0 30px rgba(20,184,166,.36);
-  }
-  .poster-wrap { width:100%; aspect-ratio: 2/3; background:#0f0f0f; display:flex; align-items:center; justify-content:center; }
-  .poster { width:100%; height:100%; object-fit:cover; display:block; }
-  .meta { padding:10px 10px 12px; display:flex; flex-direction:column; gap:6px; }
-  .title { font-weight:700; font-size:14px; line-height:1.25; }
-  .sub { font-size:12px; color:var(--muted); }
-  .overview { font-size:12px; color:var(--muted); white-space:pre-wrap; }
-  .empty { color:#999; text-align:center; padding:40px 0; }
-  footer { color:#666; text-align:center; padding:16px; font-size:12px; }
-  .badge { display:inline-block; padding:2px 6px; border-radius:6px; font-size:10px; background:#1f3e74; color:#b9d6ff; margin-left:8px; vertical-align:middle; }
-  .badge-new { background: linear-gradient(180deg, #f59e0b, #d97706); color:#111; border:1px solid rgba(245,158,11,.45); box-shadow: 0 6px 22px rgba(245,158,11,.15), 0 0 0 2px rgba(245,158,11,.15) inset; }
-  .section-title { margin:18px 2px 10px; font-size:30px; font-weight:900; letter-spacing:.3px; color:#fcd34d;
-                   text-shadow: 0 0 18px rgba(245,158,11,.4), 0 4px 24px rgba(20,184,166,.25); }
-  .divider.strong { height:3px; margin:28px 0 18px;
-                    background: linear-gradient(90deg, rgba(34,211,238,.6), rgba(20,184,166,.6), rgba(245,158,11,.45));
-                    box-shadow: 0 2px 18px rgba(20,184,166,.3), 0 0 22px rgba(245,158,11,.25); border-radius:2px; }
-
-  .locked-poster { width:280px; height:420px; background:#0f0f0f; border-radius:14px; overflow:hidden; box-shadow: 0 6px 24px rgba(0,0,0,.45); align-self:start; }
-  .locked-poster img { width:100%; height:100%; object-fit:cover; display:block; image-rendering:auto; }
-
-  /* New page condensed shows list */
-  ul.ep-list { list-style:none; padding:0; margin:8px 0 0; font-size:12px; color:#cbd5e1; }
-  ul.ep-list li { padding:2px 0; white-space:nowrap; overflow:hidden; text-overflow:ellipsis; }
-  ul.ep-list li.more { color:#9aa3ab; letter-spacing:.5px; }
-</style>
+<link href="static/app.css?v=""" + asset_version(APP_CSS.encode("utf-8")) + """" rel="stylesheet">
+"""
+
+# Detail/show pages only inline their backdrop (used by var(--backdrop) in APP_CSS)
+BACKDROP_STYLE = """<style>:root { --backdrop:url('__BACKDROP__'); }</style>
 """
 
 # ====== TEMPLATES ======
+# Card/grid rendering shared by the home and index pages, written to static/app.js by build_site
+APP_JS = """// Shared by the home and index pages; each page only calls renderHome(...) / renderIndex(DATA) with its payload
+// *_html fields arrive HTML-escaped from build_site (html_text), so cards are plain concatenation
+function mkMovieCard(m){
+  const poster=m.poster_url?m.poster_url:'';
+  const href = m.href || m.movie_href || '#';
+  return `
+    <a class="card" href="${href}">
+      <div class="poster-wrap">${poster?`<img class="poster" src="${poster}" alt="Poster of ${m.title_html}">`:`<div class="poster" style="display:flex;align-items:center;justify-content:center;color:#666;font-size:12px;">No Poster</div>`}</div>
+      <div class="meta">
+        <div class="title">${m.title_html} <span class="badge badge-new">NEW</span></div>
+        <div class="sub">${m.year||''}</div>
+        <div class="overview">${m.overview_html}</div>
+      </div>
+    </a>`;
+}
+function mkShowCard(s){
+  const poster=s.poster_url? s.poster_url:'';
+  const href = s.show_href || '#';
+  const eps  = Array.isArray(s.latest)? s.latest : [];
+  const more = s.has_more ? '<li class="more">…</li>' : '';
+  const list = eps.map(e => `<li>${e.label_html}</li>`).join('') + more;
+  return `
+    <a class="card" href="${href}">
+      <div class="poster-wrap">${poster?`<img class="poster" src="${poster}" alt="Poster of ${s.show_title_html}">`:`<div class="poster" style="display:flex;align-items:center;justify-content:center;color:#666;font-size:12px;">No Poster</div>`}</div>
+      <div class="meta">
+        <div class="title">${s.show_title_html} <span class="badge badge-new">NEW</span></div>
+        <div class="sub">${s.first_year||''}</div>
+        <ul class="ep-list">${list}</ul>
+      </div>
+    </a>`;
+}
+function mkCard(m){
+  const poster=m.poster_url?m.poster_url:'';
+  const href = m.href || '#';
+  const badges = (m.archived?'<span class="badge">ARCHIVED</span>':'') + (m.is_new?'<span class="badge badge-new">NEW</span>':'');
+  const sub = (m.year||'') + (m.genres_html?' • '+m.genres_html:'');
+  return `
+    <a class="card${m.archived?' archived':''}" href="${href}">
+      <div class="poster-wrap">${poster?`<img class="poster" src="${poster}" alt="Poster of ${m.title_html}">`:`<div class="poster" style="display:flex;align-items:center;justify-content:center;color:#666;font-size:12px;">No Poster</div>`}</div>
+      <div class="meta">
+        <div class="title">${m.title_html} ${badges}</div>
+        <div class="sub">${sub}</div>
+        <div class="overview">${m.overview_html}</div>
+      </div>
+    </a>`;
+}
+function renderHome(NEW_MOVIES, NEW_SHOWS, NEW_STAND, NEW_DOCS){
+  const gm=document.getElementById('gridMovies'),
+        gs=document.getElementById('gridShows'),
+        gst=document.getElementById('gridStandup'),
+        gd=document.getElementById('gridDocs'),
+        empty=document.getElementById('empty');
+  // one innerHTML assignment per grid: a single parse/reflow instead of one per card
+  gm.innerHTML  = NEW_MOVIES.map(mkMovieCard).join('');
+  gs.innerHTML  = NEW_SHOWS.map(mkShowCard).join('');
+  gst.innerHTML = NEW_STAND.map(mkMovieCard).join('');
+  gd.innerHTML  = NEW_DOCS.map(mkMovieCard).join('');
+  empty.style.display = (NEW_MOVIES.length || NEW_SHOWS.length || NEW_STAND.length || NEW_DOCS.length) ? 'none' : 'block';
+}
+function renderIndex(DATA){
+  const GENRES = Array.from(new Set(DATA.flatMap(m => Array.isArray(m.genres) ? m.genres : []))).sort((a,b)=>a.localeCompare(b));
+  const gsel = document.getElementById('genre'); if (gsel){ GENRES.forEach(g=>{const o=document.createElement('option');o.value=g;o.textContent=g;gsel.appendChild(o);}); }
+  let state={q:'',sort:'title',genre:'all',arch:'all'};
+  // Each ordering is sorted once, on first use; filtering a sorted list keeps it sorted (and the sort is stable)
+  const byTitle=(a,b)=>a.title.localeCompare(b.title);
+  const g0=m=>((m.genres||[])[0]||'').toLowerCase();
+  const CMP={
+    title: byTitle,
+    year:  (a,b)=>(b.year||0)-(a.year||0) || byTitle(a,b),
+    genre: (a,b)=>{const A=g0(a),B=g0(b); return A===B? byTitle(a,b):(A<B?-1:1);},
+  };
+  const ORDER={};
+  function ordered(key){ if(!CMP[key]) key='title'; return ORDER[key] || (ORDER[key]=DATA.slice().sort(CMP[key])); }
+  function render(){
+    const grid=document.getElementById('grid'), empty=document.getElementById('empty');
+    let list=ordered(state.sort);
+    const q=state.q.trim().toLowerCase();
+    if(q){ list=list.filter(m=>m._lc.includes(q)); }
+    if(gsel && state.genre!=='all'){ list=list.filter(m=>(m.genres||[]).includes(state.genre)); }
+    if(document.getElementById('arch')){
+      if(state.arch==='active') list=list.filter(m=>!m.archived);
+      if(state.arch==='archived') list=list.filter(m=>m.archived);
+    }
+    grid.innerHTML=list.map(mkCard).join('');
+    empty.style.display=list.length?'none':'block';
+  }
+  const qi=document.getElementById('q'); if(qi) qi.addEventListener('input',e=>{state.q=e.target.value;render();});
+  const si=document.getElementById('sort'); if(si) si.addEventListener('change',e=>{state.sort=e.target.value;render();});
+  const ai=document.getElementById('arch'); if(ai) ai.addEventListener('change',e=>{state.arch=e.target.value;render();});
+  if(gsel) gsel.addEventListener('change',e=>{state.genre=e.target.value;render();});
+  render();
+}
+"""
+APP_JS_SRC = "static/app.js?v=" + asset_version(APP_JS.encode("utf-8"))
+
 def header_nav(active: str):
     def tab(href, text, key, gold=False):
         cls = "tab gold active" if gold and active==key else "tab gold" if gold else "tab active" if active==key else "tab"
@@ -789,6 +1366,9 @@ def header_nav(active: str):
     </div>
     """
 
+# The nav bar only varies by which tab is active: render each variant once at import
+HEADER_NAV = {key: header_nav(key) for key in ("new", "movies", "shows", "standup", "docs")}
+
 HOME_TEMPLATE = """<!doctype html>
 <html lang="en">
 <head><meta charset="utf-8"/><meta name="viewport" content="width=device-width, initial-scale=1"/>
@@ -797,7 +1377,7 @@ HOME_TEMPLATE = """<!doctype html>
 <body>
 <header>
   <div class="topbar">
-    """ + header_nav("new") + """
+    """ + HEADER_NAV["new"] + """
     <div class="rightstats">New Movies Size <b>__NEW_MOV_SIZE__</b> • New Shows Size <b>__NEW_EPS_SIZE__</b></div>
   </div>
 </header>
@@ -820,68 +1400,13 @@ HOME_TEMPLATE = """<!doctype html>
   <div id="empty" class="empty" style="display:none;">Nothing new yet.</div>
 </main>
 <footer>Built locally. Posters & metadata courtesy of TMDB.</footer>
-<script>
-  const NEW_MOVIES = __NEW_MOVIES_JSON__;
-  const NEW_SHOWS  = __NEW_SHOWS_JSON__;
-  const NEW_STAND  = __NEW_STAND_JSON__;
-  const NEW_DOCS   = __NEW_DOCS_JSON__;
-  function escapeHtml(s){return (s||'').replace(/[&<>"']/g,c=>({'&':'&amp;','<':'&lt;','>':'&gt;','"':'&quot;',"'":'&#39;'}[c]));}
-  function mkMovieCard(m){
-    const poster=m.poster_url?m.poster_url:'';
-    const href = m.href || m.movie_href || '#';
-    return `
-      <a class="card" href="${href}">
-        <div class="poster-wrap">${poster?`<img class="poster" src="${poster}" alt="Poster of ${escapeHtml(m.title)}">`:`<div class="poster" style="display:flex;align-items:center;justify-content:center;color:#666;font-size:12px;">No Poster</div>`}</div>
-        <div class="meta">
-          <div class="title">${escapeHtml(m.title)} <span class="badge badge-new">NEW</span></div>
-          <div class="sub">${m.year||''}</div>
-          <div class="overview">${escapeHtml(m.overview||'')}</div>
-        </div>
-      </a>`;
-  }
-  function mkShowCard(s){
-    const poster=s.poster_url? s.poster_url:'';
-    const href = s.show_href || '#';
-    const eps  = Array.isArray(s.latest)? s.latest : [];
-    const more = s.has_more ? '<li class="more">…</li>' : '';
-    const list = eps.map(e => `<li>${escapeHtml(e.label)}</li>`).join('') + more;
-    return `
-      <a class="card" href="${href}">
-        <div class="poster-wrap">${poster?`<img class="poster" src="${poster}" alt="Poster of ${escapeHtml(s.show_title)}">`:`<div class="poster" style="display:flex;align-items:center;justify-content:center;color:#666;font-size:12px;">No Poster</div>`}</div>
-        <div class="meta">
-          <div class="title">${escapeHtml(s.show_title)} <span class="badge badge-new">NEW</span></div>
-          <div class="sub">${s.first_year||''}</div>
-          <ul class="ep-list">${list}</ul>
-        </div>
-      </a>`;
-  }
-  function render(){
-    const gm=document.getElementById('gridMovies'),
-          gs=document.getElementById('gridShows'),
-          gst=document.getElementById('gridStandup'),
-          gd=document.getElementById('gridDocs'),
-          empty=document.getElementById('empty');
-    gm.innerHTML=''; gs.innerHTML=''; gst.innerHTML=''; gd.innerHTML='';
-    NEW_MOVIES.forEach(m=>gm.insertAdjacentHTML('beforeend', mkMovieCard(m)));
-    NEW_SHOWS.forEach(s=>gs.insertAdjacentHTML('beforeend', mkShowCard(s)));
-    NEW_STAND.forEach(m=>gst.insertAdjacentHTML('beforeend', mkMovieCard(m)));
-    NEW_DOCS.forEach(m=>gd.insertAdjacentHTML('beforeend', mkMovieCard(m)));
-    empty.style.display = (NEW_MOVIES.length || NEW_SHOWS.length || NEW_STAND.length || NEW_DOCS.length) ? 'none' : 'block';
-  }
-  render();
-</script>
+<script src=\"""" + APP_JS_SRC + """"></script>
+<script src="__DATA_SRC__"></script>
 </body></html>
 """
 
+@lru_cache(maxsize=8)
 def build_index_template(page_key: str, title: str):
-    top = f"""<!doctype html><html lang="en"><head>
-<meta charset="utf-8"/><meta name="viewport" content="width=device-width, initial-scale=1"/>
-<title>My Local Cinema — {title}</title>{HEADER_TOP}</head><body>
-<header><div class="topbar">{header_nav(page_key)}
-  <div class="rightstats">__RIGHTSTATS__</div>
-</div>__CONTROLS__</header><main>
-  <div id="grid" class="grid"></div><div id="empty" class="empty" style="display:none;">No matches.</div>
-</main><footer>Built locally. Posters & metadata courtesy of TMDB.</footer>"""
     if page_key == "shows":
         controls = """
   <div class="controls">
@@ -899,84 +1424,25 @@ def build_index_template(page_key: str, title: str):
     <label for="arch">Archived:</label><select id="arch"><option value="all">All</option><option value="active">Hide Archived</option><option value="archived">Only Archived</option></select>
   </div>"""
         right = "Active <b>__ACTIVE_COUNT__</b> <span class='size'>(__ACTIVE_SIZE__)</span> • Archived <b>__ARCH_COUNT__</b> <span class='size'>(__ARCH_SIZE__)</span> • Total <b>__TOTAL_COUNT__</b> <span class='size'>(__TOTAL_SIZE__)</span>"
-    return top.replace("__CONTROLS__", controls).replace("__RIGHTSTATS__", right) + """
-<script>
-  const DATA = __JSON__;
-  function escapeHtml(s){return (s||'').replace(/[&<>"']/g,c=>({'&':'&amp;','<':'&lt;','>':'&gt;','"':'&quot;',"'":'&#39;'}[c]));}
-  function mkCard(m){
-    const poster=m.poster_url?m.poster_url:'';
-    const href = m.href || '#';
-    const badges = (m.archived?'<span class="badge">ARCHIVED</span>':'') + (m.is_new?'<span class="badge badge-new">NEW</span>':'');
-    const sub = (m.year||'') + ((m.genres&&m.genres.length)?' • '+escapeHtml(m.genres.join(', ')):'');
-    return `
-      <a class="card${m.archived?' archived':''}" href="${href}">
-        <div class="poster-wrap">${poster?`<img class="poster" src="${poster}" alt="Poster of ${escapeHtml(m.title)}">`:`<div class="poster" style="display:flex;align-items:center;justify-content:center;color:#666;font-size:12px;">No Poster</div>`}</div>
-        <div class="meta">
-          <div class="title">${escapeHtml(m.title)} ${badges}</div>
-          <div class="sub">${sub}</div>
-          <div class="overview">${escapeHtml(m.overview||'')}</div>
-        </div>
-      </a>`;
-  }
-  const GENRES = Array.from(new Set(DATA.flatMap(m => Array.isArray(m.genres) ? m.genres : []))).sort((a,b)=>a.localeCompare(b));
-  const gsel = document.getElementById('genre'); if (gsel){ GENRES.forEach(g=>{const o=document.createElement('option');o.value=g;o.textContent=g;gsel.appendChild(o);}); }
-  let state={q:'',sort:'title',genre:'all',arch:'all'};
-  function render(){
-    const grid=document.getElementById('grid'), empty=document.getElementById('empty'); grid.innerHTML='';
-    let list=DATA.slice();
-    const q=state.q.trim().toLowerCase();
-    if(q){ list=list.filter(m=>(m.title||'').toLowerCase().includes(q) || String(m.year||'').includes(q)); }
-    if(gsel && state.genre!=='all'){ list=list.filter(m=>(m.genres||[]).includes(state.genre)); }
-    if(document.getElementById('arch')){
-      if(state.arch==='active') list=list.filter(m=>!m.archived);
-      if(state.arch==='archived') list=list.filter(m=>m.archived);
-    }
-    if(state.sort==='year'){ list.sort((a,b)=>(b.year||0)-(a.year||0) || a.title.localeCompare(b.title)); }
-    else if(state.sort==='genre'){ const g0=m=>((m.genres||[])[0]||'').toLowerCase(); list.sort((a,b)=>{const A=g0(a),B=g0(b); return A===B? a.title.localeCompare(b.title):(A<B?-1:1);}); }
-    else { list.sort((a,b)=>a.title.localeCompare(b.title)); }
-    list.forEach(m=>grid.insertAdjacentHTML('beforeend', mkCard(m)));
-    empty.style.display=list.length?'none':'block';
-  }
-  const qi=document.getElementById('q'); if(qi) qi.addEventListener('input',e=>{state.q=e.target.value;render();});
-  const si=document.getElementById('sort'); if(si) si.addEventListener('change',e=>{state.sort=e.target.value;render();});
-  const ai=document.getElementById('arch'); if(ai) ai.addEventListener('change',e=>{state.arch=e.target.value;render();});
-  if(gsel) gsel.addEventListener('change',e=>{state.genre=e.target.value;render();});
-  render();
-</script>
+    return f"""<!doctype html><html lang="en"><head>
+<meta charset="utf-8"/><meta name="viewport" content="width=device-width, initial-scale=1"/>
+<title>My Local Cinema — {title}</title>{HEADER_TOP}</head><body>
+<header><div class="topbar">{HEADER_NAV[page_key]}
+  <div class="rightstats">{right}</div>
+</div>{controls}</header><main>
+  <div id="grid" class="grid"></div><div id="empty" class="empty" style="display:none;">No matches.</div>
+</main><footer>Built locally. Posters & metadata courtesy of TMDB.</footer>
+<script src="{APP_JS_SRC}"></script>
+<script src="__DATA_SRC__"></script>
 </body></html>
 """
 
+@lru_cache(maxsize=8)
 def detail_template(active_tab_key: str):
     return f"""<!doctype html><html lang="en"><head><meta charset="utf-8"/>
 <title>Details — __TITLE__</title>{HEADER_TOP}
-<style>
-  body {{
-    min-height:100vh;
-    background:
-      linear-gradient(180deg, rgba(0,0,0,.75) 0%, rgba(0,0,0,.85) 40%, rgba(0,0,0,.95) 100%),
-      url('__BACKDROP__') center / cover fixed no-repeat, #000;
-  }}
-  main {{ padding:26px 20px 30px; max-width:1040px; margin:0 auto; }}
-  .wrap {{ display:grid; grid-template-columns: 280px 1fr; gap:22px; align-items:start; }}
-  h1 {{ margin:0 0 6px; font-size:32px; line-height:1.15; }}
-  .sub {{ color:var(--muted); margin-bottom:14px; font-size:14px; }}
-  .badge {{ display:inline-block; padding:2px 6px; border-radius:6px; font-size:10px; background:#1f3e74; color:#b9d6ff; margin-left:8px; vertical-align:middle; }}
-  .meta-row {{ display:flex; flex-wrap:wrap; gap:12px 18px; margin:8px 0 16px; font-size:14px; color:#ddd;}}
-  .chip {{ background:rgba(255,255,255,.08); border:1px solid #444; padding:6px 10px; border-radius:999px; }}
-  .section {{ margin-top:16px; }}
-  .label {{ font-size:12px; color:#aaa; margin-bottom:6px; }}
-  .cast {{ display:flex; flex-wrap:wrap; gap:8px; font-size:13px; color:#ddd; }}
-  .actions {{ margin-top:14px; display:flex; gap:10px; }}
-  .btn {{ display:inline-flex; align-items:center; gap:8px; padding:10px 14px; background:#fff; color:#000; text-decoration:none; border-radius:10px; font-weight:700; border:1px solid #ddd; }}
-  .icon {{ width:16px; height:16px; display:inline-block; }}
-  .fileinfo {{ margin-top:10px; background: rgba(20,184,166,.08); border:1px solid rgba(20,184,166,.35);
-              border-radius:12px; padding:10px 12px; box-shadow: 0 0 0 2px rgba(20,184,166,.15), 0 16px 36px rgba(20,184,166,.20);
-              display:flex; align-items:center; gap:10px; flex-wrap:wrap; }}
-  .fileinfo .fn {{ font-weight:700; }}
-  .fileinfo .fs {{ color:#9aa3ab; }}
-</style>
-</head><body>
-<header><div class="topbar">{header_nav(active_tab_key)}<div></div></div></header>
+{BACKDROP_STYLE}</head><body class="detail">
+<header><div class="topbar">{HEADER_NAV[active_tab_key]}<div></div></div></header>
 <main>
   <div class="wrap">
     <div class="locked-poster">__POSTER_HTML__</div>
@@ -1009,36 +1475,9 @@ def detail_template(active_tab_key: str):
 SHOW_PAGE_TEMPLATE = """<!doctype html>
 <html lang="en">
 <head><meta charset="utf-8"/><title>Show — __TITLE__</title>""" + HEADER_TOP + """
-<style>
-  body { min-height:100vh;
-    background:
-      linear-gradient(180deg, rgba(0,0,0,.75) 0%, rgba(0,0,0,.85) 40%, rgba(0,0,0,.95) 100%),
-      url('__BACKDROP__') center / cover fixed no-repeat, #000; }
-  main { padding:26px 20px 30px; max-width:1100px; margin:0 auto; }
-  .wrap { display:grid; grid-template-columns: 280px 1fr; gap:22px; align-items:start; }
-  h1 { margin:0 0 6px; font-size:32px; line-height:1.15; }
-  .sub { color:var(--muted); margin-bottom:14px; font-size:14px; }
-  .meta-row { display:flex; flex-wrap:wrap; gap:12px 18px; margin:8px 0 16px; font-size:14px; color:#ddd;}
-  .chip { background:rgba(255,255,255,.08); border:1px solid #444; padding:6px 10px; border-radius:999px; }
-  .section { margin-top:16px; }
-  .label { font-size:12px; color:#aaa; margin-bottom:6px; }
-  .cast { display:flex; flex-wrap:wrap; gap:8px; font-size:13px; color:#ddd; }
-  .season { margin-top:16px; background:rgba(255,255,255,.06); border:1px solid #333; border-radius:12px; padding:12px; }
-  .season h2 { margin:0 0 12px; font-size:18px; letter-spacing:.3px; }
-  .ep { display:flex; align-items:center; justify-content:space-between; gap:12px; padding:8px 10px; border-radius:10px; }
-  .ep:hover { background:rgba(20,184,166,.08); box-shadow: inset 0 0 0 1px rgba(20,184,166,.3); }
-  .ep .info { display:flex; gap:10px; align-items:center; flex-wrap:wrap; }
-  .btn { display:inline-flex; align-items:center; gap:8px; padding:8px 12px; background:#fff; color:#000; text-decoration:none; border-radius:10px; font-weight:700; border:1px solid #ddd; }
-  .icon { width:16px; height:16px; display:inline-block; }
-  .filesize { color:#9aa3ab; font-size:12px; }
-  .badge { display:inline-block; padding:2px 6px; border-radius:6px; font-size:10px; background:#1f3e74; color:#b9d6ff; vertical-align:middle; }
-  .badge-new { background: linear-gradient(180deg, #f59e0b, #d97706); color:#111; border:1px solid rgba(245,158,11,.45); box-shadow: 0 6px 22px rgba(245,158,11,.15), 0 0 0 2px rgba(245,158,11,.15) inset; margin-right:8px; }
-  .locked-poster { width:280px; height:420px; background:#0f0f0f; border-radius:14px; overflow:hidden; box-shadow: 0 6px 24px rgba(0,0,0,.45); align-self:start; }
-  .locked-poster img { width:100%; height:100%; object-fit:cover; display:block; image-rendering:auto; }
-</style>
-</head>
-<body>
-<header><div class="topbar">""" + header_nav("shows") + """<div></div></div></header>
+""" + BACKDROP_STYLE + """</head>
+<body class="show-page">
+<header><div class="topbar">""" + HEADER_NAV["shows"] + """<div></div></div></header>
 <main>
   <div class="wrap">
     <div class="locked-poster">__POSTER_HTML__</div>
@@ -1060,34 +1499,167 @@ SHOW_PAGE_TEMPLATE = """<!doctype html>
 </body></html>
 """
 
+# One show-page episode row, %-formatted per episode: label, size, new badge, quoted eid
+EPISODE_ROW = """
+                  <div class="ep">
+                    <div class="info"><div>%s</div><div class="filesize">(%s)</div></div>
+                    <div style="display:flex; align-items:center; gap:8px;">
+                      %s
+                      <a class="btn" href="/play_ep?id=%s">
+                        <svg class="icon" viewBox="0 0 24 24" aria-hidden="true"><path d="M8 5v14l11-7z"/></svg>Play
+                      </a>
+                    </div>
+                  </div>
+                """
+NEW_BADGE = '<span class="badge badge-new">NEW</span>'
+
 # ====== BUILD SITE ======
+def card_html(title, overview, genres=None) -> dict:
+    # escaped once at build time, so the card builders in APP_JS can concatenate them as-is on every render
+    out = {"title_html": html_text(title), "overview_html": html_text(overview)}
+    if genres is not None: out["genres_html"] = html_text(", ".join(genres))
+    return out
+
+def search_key(title, year=None) -> str:
+    # lowered once at build time for the index pages' search box; the newline keeps a query from spanning title and year
+    return (title or "").lower() + "\n" + str(year or "")
+
+def home_cards(items) -> list:
+    # only what mkMovieCard reads on the home page
+    return [{"year": m["year"], "poster_url": m["poster_url"], **card_html(m["title"], m.get("overview","")),
+             "href": m.get("href","")} for m in items]
+
+# Per-item fields persisted to <category>_meta.json (and read back by the detail pages), with their defaults
+MEDIA_META_FIELDS = (("title", None), ("year", None), ("poster_url", ""), ("overview", ""), ("archived", False),
+                     ("genres", []), ("runtime", None), ("vote", None), ("certification", None), ("cast", []),
+                     ("backdrop_url", ""), ("tagline", ""), ("mtime", 0), ("is_new", False))
+
+# Detail pages are prebuilt into pages/<id>.html (ids are unique across categories: m*, s*, d*, tv*)
+PAGES_DIR = "pages"
+PLAY_PREFIX = {"movies": "/play_movie?id=", "standup": "/play_standup?id=", "docs": "/play_doc?id="}
+
+def media_detail_page(active_key, mid, meta, filepath, file_size) -> bytes:
+    title = meta.get("title","Unknown Title")
+    year  = meta.get("year","")
+    poster_url = meta.get("poster_url","")
+    overview   = meta.get("overview","")
+    archived   = bool(meta.get("archived", False))
+    genres     = meta.get("genres",[])
+    runtime    = meta.get("runtime")
+    vote       = meta.get("vote")
+    cert       = meta.get("certification") or "NR"
+    cast       = meta.get("cast",[])
+    backdrop   = meta.get("backdrop_url","")
+    tagline    = meta.get("tagline","")
+
+    poster_html = f'<img src="{html_attr(poster_url)}" alt="Poster">' if poster_url else '<div style="width:100%;height:100%;display:flex;align-items:center;justify-content:center;color:#666;">No Poster</div>'
+    archived_badge = ' <span class="badge">ARCHIVED</span>' if archived else ''
+    genres_html = html_list(tuple(genres or ()))
+    runtime_txt = minutes_to_hm(runtime) or "—"
+    vote_txt    = f"{vote:.1f}" if isinstance(vote,(int,float)) else "—"
+    tagline_txt = tagline or ""
+    subsep      = " • " if tagline_txt else ""
+    filename = os.path.basename(filepath) if filepath else "—"
+    filesize_txt = format_size_lower(file_size) if file_size is not None else "—"
+
+    return fill_template(detail_template(active_key), {
+        "TITLE":          html_text(title),
+        "YEAR":           html_text(str(year or "")),
+        "POSTER_HTML":    poster_html,
+        "OVERVIEW":       html_text(overview or ""),
+        "ARCHIVED_BADGE": archived_badge,
+        "GENRES":         genres_html or "—",
+        "RUNTIME":        html_text(runtime_txt),
+        "VOTE":           html_text(vote_txt),
+        "CERT":           html_text(cert),
+        "TAGLINE":        html_text(tagline_txt),
+        "SUBSEP":         subsep,
+        "BACKDROP":       html_attr(backdrop),
+        "FILENAME":       html_text(filename),
+        "FILESIZE":       html_text(filesize_txt),
+        "PLAY_HREF":      f"{PLAY_PREFIX[active_key]}{urllib.parse.quote(mid)}",
+    }).encode("utf-8")
+
+def show_detail_page(meta) -> bytes:
+    title = meta.get("title","Unknown Show")
+    poster_url = meta.get("poster_url","")
+    overview   = meta.get("overview","")
+    genres     = meta.get("genres",[])
+    vote       = meta.get("vote")
+    cast       = meta.get("cast",[])
+    backdrop   = meta.get("backdrop_url","")
+    tagline    = meta.get("tagline","")
+    first_year = meta.get("first_year")
+
+    poster_html = f'<img src="{html_attr(poster_url)}" alt="Poster">' if poster_url else '<div style="width:100%;height:100%;display:flex;align-items:center;justify-content:center;color:#666;">No Poster</div>'
+    genres_html = html_list(tuple(genres or ()))
+    cast_html   = html_list(tuple(cast or ()))
+    vote_txt    = f"{vote:.1f}" if isinstance(vote,(int,float)) else "—"
+    tagline_txt = tagline or ""
+    subsep      = " • " if tagline_txt else ""
+    fy_txt      = str(first_year) if first_year else ""
+
+    seasons = meta.get("seasons", {})
+    season_nums = sorted((int(k) for k in seasons.keys()))
+    # every season and episode row goes straight into one buffer (no per-season join, no blocks list)
+    sink = io.StringIO()
+    for i, snum in enumerate(season_nums):
+        if i: sink.write("\n")
+        sink.write(f"<div class='season'><h2>Season {snum}</h2>")
+        for ep in seasons.get(str(snum), []):
+            sink.write(EPISODE_ROW % (
+                f"S{snum:02d}E{ep['e']:02d}" + (f" — {html_text(ep['title'])}" if ep.get("title") else ""),
+                format_size_lower(ep.get("size",0)),
+                NEW_BADGE if ep.get("is_new") else "",
+                urllib.parse.quote(ep["eid"]),
+            ))
+        sink.write("</div>")
+    seasons_html = sink.getvalue() if season_nums else "<div class='section'><div class='label'>No episodes found.</div></div>"
+
+    return fill_template(SHOW_PAGE_TEMPLATE, {
+        "TITLE":        html_text(title),
+        "POSTER_HTML":  poster_html,
+        "OVERVIEW":     html_text(overview or ""),
+        "GENRES":       genres_html,
+        "CAST":         cast_html,
+        "VOTE":         vote_txt,
+        "TAGLINE":      html_text(tagline_txt),
+        "FIRSTYEAR":    html_text(fy_txt),
+        "SUBSEP":       subsep,
+        "SEASONS_HTML": seasons_html,
+        "BACKDROP":     html_attr(backdrop),
+    }).encode("utf-8")
+
 def build_site(movies_root: str, shows_root: str, standup_root: str, docs_root: str):
     site_dir = os.path.join(movies_root, OUTPUT_DIR_NAME)
     os.makedirs(site_dir, exist_ok=True)
 
-    # ---- Movies ----
-    movies = discover_category(movies_root, id_prefix="m")
-    movies = enrich_movies(movies, site_dir)
+    # ---- Discover + enrich ----
+    # Movies/Standup/Documentary share tmdb_movie_cache.json, so they go through one enrich_movies pass (one
+    # cache load/save, duplicate titles looked up once); shows use their own caches and run alongside on a thread.
+    def load_movie_like():
+        found = [discover_category(movies_root, id_prefix="m"), discover_category(standup_root, id_prefix="s"),
+                 discover_category(docs_root, id_prefix="d")]
+        enriched = iter(enrich_movies([it for items in found for it in items], site_dir))
+        return [[next(enriched) for _ in items] for items in found]
+
+    def load_shows():
+        shows_list, shows_meta, _ = discover_shows(shows_root)
+        shows_list, shows_meta = enrich_shows(shows_list, shows_meta, site_dir)
+        return shows_list, fill_episode_titles_from_tmdb(shows_meta, site_dir)
+
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        shows_job = ex.submit(load_shows)
+        movies, standup, docs = load_movie_like()
+        shows_list, shows_meta = shows_job.result()
+
     for m in movies:
         m["href"] = f"/movie?id={urllib.parse.quote(m['id'])}" if m.get("abs_path") else ""
-
-    # ---- Standup ----
-    standup = discover_category(standup_root, id_prefix="s")
-    standup = enrich_movies(standup, site_dir)
     for it in standup:
         it["href"] = f"/standup_item?id={urllib.parse.quote(it['id'])}" if it.get("abs_path") else ""
-
-    # ---- Documentary ----
-    docs = discover_category(docs_root, id_prefix="d")
-    docs = enrich_movies(docs, site_dir)
     for it in docs:
         it["href"] = f"/doc_item?id={urllib.parse.quote(it['id'])}" if it.get("abs_path") else ""
 
-    # ---- Shows ----
-    shows_list, shows_meta, episodes_index = discover_shows(shows_root)
-    shows_list, shows_meta = enrich_shows(shows_list, shows_meta, site_dir)
-    shows_meta = fill_episode_titles_from_tmdb(shows_meta, site_dir)
-
     # Rebuild episodes index
     episodes_index = {}
     for sid, meta in shows_meta.items():
@@ -1096,94 +1668,103 @@ def build_site(movies_root: str, shows_root: str, standup_root: str, docs_root:
                 episodes_index[ep["eid"]] = ep["file"]
 
     # ---- "NEW" Home ----
-    newest_movies = sorted([m for m in movies if m.get("abs_path")], key=lambda x: x.get("mtime", 0.0), reverse=True)[:16]
+    newest_movies = nlargest(16, (m for m in movies if m.get("abs_path")), key=lambda x: x.get("mtime", 0.0))
     new_movie_ids = {m["id"] for m in newest_movies}
-    new_movies_bytes = sum(safe_size(m["abs_path"]) for m in newest_movies)
+    new_movies_bytes = sum(m["size"] for m in newest_movies)
 
     # Condensed shows (by show, list latest 5 per show)
-    eps_flat = []
+    # Show-level fields live in shows_meta; per-episode rows carry only what differs per episode
+    by_show = defaultdict(list)
     for sid, meta in shows_meta.items():
-        for skey, eps in meta.get("seasons", {}).items():
+        rows = by_show[sid]
+        for skey, eps in meta["seasons"].items():
+            s = int(skey)
             for ep in eps:
-                eps_flat.append({
-                    "sid": sid, "eid": ep["eid"], "show_title": meta.get("title",""),
-                    "poster_url": meta.get("poster_url",""), "overview": meta.get("overview",""),
-                    "show_href": f"/show?id={urllib.parse.quote(sid)}",
-                    "s": int(skey), "e": ep.get("e"), "title": ep.get("title",""),
-                    "mtime": ep.get("mtime", 0.0), "size": ep.get("size", 0), "first_year": meta.get("first_year")
-                })
-    by_show = {}
-    for e in eps_flat: by_show.setdefault(e["sid"], []).append(e)
-    for sid in by_show: by_show[sid].sort(key=lambda x: x["mtime"], reverse=True)
-    ordered_shows = sorted(by_show.keys(), key=lambda sid: by_show[sid][0]["mtime"] if by_show[sid] else 0.0, reverse=True)[:16]
+                rows.append({"eid": ep["eid"], "s": s, "e": ep["e"], "title": ep["title"],
+                             "mtime": ep["mtime"], "size": ep["size"]})
+    # nlargest == sorted(..., reverse=True)[:n] (ties keep discovery order) without sorting whole seasons
+    newest_ep = {sid: max(e["mtime"] for e in rows) for sid, rows in by_show.items() if rows}
+    ordered_shows = nlargest(16, newest_ep, key=newest_ep.get)
 
+    show_hrefs = {s["id"]: s["show_href"] for s in shows_list}   # quoted once by discover_shows
     new_shows_payload, included_ep_eids, new_shows_bytes = [], set(), 0
     for sid in ordered_shows:
-        episodes = by_show[sid]
-        latest5 = episodes[:5]
+        episodes, meta = by_show[sid], shows_meta[sid]
+        latest5 = nlargest(5, episodes, key=lambda x: x["mtime"])
         for e in latest5:
             included_ep_eids.add(e["eid"])
-            new_shows_bytes += e.get("size", 0)
-        has_more = len(episodes) > 5
-        meta0 = episodes[0] if episodes else {"show_title":"", "poster_url":"", "overview":"", "show_href":"", "first_year":""}
+            new_shows_bytes += e["size"]
+        # only what mkShowCard reads
         new_shows_payload.append({
-            "sid": sid, "show_title": meta0["show_title"], "poster_url": meta0["poster_url"],
-            "overview": meta0["overview"], "show_href": meta0["show_href"], "first_year": meta0.get("first_year"),
-            "has_more": has_more, "latest": [{
-                "s": e["s"], "e": e["e"], "title": e.get("title",""),
-                "label": f"S{e['s']:02d}E{e['e']:02d}" + (f" — {e['title']}" if e.get('title') else "")
+            "show_title_html": html_text(meta["title"]), "poster_url": meta["poster_url"],
+            "show_href": show_hrefs[sid], "first_year": meta["first_year"],
+            "has_more": len(episodes) > 5, "latest": [{
+                # SxxEyy needs no escaping: only the title goes through (and into the cache of) html_text
+                "label_html": f"S{e['s']:02d}E{e['e']:02d}" + (f" — {html_text(e['title'])}" if e["title"] else "")
             } for e in latest5]
         })
 
     # Mark "is_new"
     for m in movies:  m["is_new"]  = m["id"] in new_movie_ids
-    for s in shows_list: s["is_new"] = s["id"] in set(ordered_shows)
+    new_show_ids = set(ordered_shows)
+    for s in shows_list: s["is_new"] = s["id"] in new_show_ids
     for sid, meta in shows_meta.items():
         for skey, eps in meta.get("seasons", {}).items():
             for ep in eps: ep["is_new"] = ep["eid"] in included_ep_eids
 
     # New Standup / New Docs (top 16 by mtime)
-    newest_stand = sorted([x for x in standup if x.get("abs_path")], key=lambda x: x.get("mtime", 0.0), reverse=True)[:16]
-    newest_docs  = sorted([x for x in docs if x.get("abs_path")], key=lambda x: x.get("mtime", 0.0), reverse=True)[:16]
-    for it in standup: it["is_new"] = it["id"] in {m["id"] for m in newest_stand}
-    for it in docs:    it["is_new"] = it["id"] in {m["id"] for m in newest_docs}
+    newest_stand = nlargest(16, (x for x in standup if x.get("abs_path")), key=lambda x: x.get("mtime", 0.0))
+    newest_docs  = nlargest(16, (x for x in docs if x.get("abs_path")), key=lambda x: x.get("mtime", 0.0))
+    new_stand_ids = {m["id"] for m in newest_stand}
+    new_docs_ids  = {m["id"] for m in newest_docs}
+    for it in standup: it["is_new"] = it["id"] in new_stand_ids
+    for it in docs:    it["is_new"] = it["id"] in new_docs_ids
 
     # ---- Persist ----
+    os.makedirs(os.path.join(site_dir, "static"), exist_ok=True)
+    write_with_gzip(os.path.join(site_dir, "static", "app.css"), APP_CSS.encode("utf-8"))
+    write_with_gzip(os.path.join(site_dir, "static", "app.js"), APP_JS.encode("utf-8"))
+    os.makedirs(os.path.join(site_dir, "data"), exist_ok=True)
+
+    def write_data_script(name, call, *payloads):
+        # data/<name>: the page's bootstrap call with its payload, so the HTML stays small and the data is cacheable
+        data = f"{call}({','.join(json_compact(p) for p in payloads)});\n".encode("utf-8")
+        write_with_gzip(os.path.join(site_dir, "data", name), data)
+        return f"data/{name}?v={asset_version(data)}"
+
     site_dir_json = lambda name: os.path.join(site_dir, name)
     def dump_json(name, obj):
-        with open(site_dir_json(name), "w", encoding="utf-8") as f: json.dump(obj, f, ensure_ascii=False, indent=2)
-
-    dump_json("movies_index.json", {m["id"]: m["abs_path"] for m in movies if m["abs_path"]})
-    dump_json("movies_meta.json", {
-        m["id"]: {"title": m["title"], "year": m["year"], "poster_url": m["poster_url"], "overview": m["overview"],
-                  "archived": m.get("archived", False), "genres": m.get("genres", []), "runtime": m.get("runtime"),
-                  "vote": m.get("vote"), "certification": m.get("certification"), "cast": m.get("cast", []),
-                  "backdrop_url": m.get("backdrop_url", ""), "tagline": m.get("tagline", ""), "mtime": m.get("mtime", 0),
-                  "is_new": m.get("is_new", False)} for m in movies
-    })
-    dump_json("standup_index.json", {m["id"]: m["abs_path"] for m in standup if m["abs_path"]})
-    dump_json("standup_meta.json", {
-        m["id"]: {"title": m["title"], "year": m["year"], "poster_url": m["poster_url"], "overview": m["overview"],
-                  "archived": m.get("archived", False), "genres": m.get("genres", []), "runtime": m.get("runtime"),
-                  "vote": m.get("vote"), "certification": m.get("certification"), "cast": m.get("cast", []),
-                  "backdrop_url": m.get("backdrop_url", ""), "tagline": m.get("tagline", ""), "mtime": m.get("mtime", 0),
-                  "is_new": m.get("is_new", False)} for m in standup
-    })
-    dump_json("docs_index.json", {m["id"]: m["abs_path"] for m in docs if m["abs_path"]})
-    dump_json("docs_meta.json", {
-        m["id"]: {"title": m["title"], "year": m["year"], "poster_url": m["poster_url"], "overview": m["overview"],
-                  "archived": m.get("archived", False), "genres": m.get("genres", []), "runtime": m.get("runtime"),
-                  "vote": m.get("vote"), "certification": m.get("certification"), "cast": m.get("cast", []),
-                  "backdrop_url": m.get("backdrop_url", ""), "tagline": m.get("tagline", ""), "mtime": m.get("mtime", 0),
-                  "is_new": m.get("is_new", False)} for m in docs
-    })
+        # unchanged library -> identical bytes: skip the write, so a file's mtime only moves when its content does
+        write_if_changed(site_dir_json(name), json_compact(obj).encode("utf-8"))
+
+    # Detail pages: one static file per item, served as-is by the handler
+    pages_dir = os.path.join(site_dir, PAGES_DIR)
+    os.makedirs(pages_dir, exist_ok=True)
+    page_names = set()
+    def write_page(pid, page):
+        name = pid + ".html"
+        write_with_gzip(os.path.join(pages_dir, name), page)
+        page_names.update((name, name + ".gz"))
+
+    for prefix, items in (("movies", movies), ("standup", standup), ("docs", docs)):
+        metas = {}
+        for m in items:
+            meta = metas[m["id"]] = {k: m.get(k, d) for k, d in MEDIA_META_FIELDS}
+            write_page(m["id"], media_detail_page(prefix, m["id"], meta, m["abs_path"], m["size"] if m["abs_path"] else None))
+        dump_json(f"{prefix}_index.json", {m["id"]: m["abs_path"] for m in items if m["abs_path"]})
+        dump_json(f"{prefix}_meta.json", metas)
+    for sid, meta in shows_meta.items(): write_page(sid, show_detail_page(meta))
     dump_json("shows_meta.json", shows_meta)
     dump_json("episodes_index.json", episodes_index)
+    for name in os.listdir(pages_dir):   # items that left the library
+        if name not in page_names: os.remove(os.path.join(pages_dir, name))
 
     # ---- Render pages ----
+    size_cache_path = os.path.join(site_dir, "folder_size_cache.json")
+    size_cache = load_cache(size_cache_path)
+
     def sizes_for_category(root):
-        active_bytes = folder_size(root, exclude_names={OUTPUT_DIR_NAME, ARCHIVED_DIR_NAME})
-        archived_bytes = folder_size(os.path.join(root, ARCHIVED_DIR_NAME), exclude_names={OUTPUT_DIR_NAME})
+        active_bytes, archived_bytes = category_sizes(root, cache=size_cache)
         total_bytes = active_bytes + archived_bytes
         return active_bytes, archived_bytes, total_bytes
 
@@ -1191,72 +1772,76 @@ def build_site(movies_root: str, shows_root: str, standup_root: str, docs_root:
         active = [m for m in items if m.get("abs_path") and not m.get("archived")]
         archived = [m for m in items if m.get("abs_path") and m.get("archived")]
         a, b, t = sizes_for_category(root)
-        tpl = build_index_template(page_key, title)
-        html = (tpl
-            .replace("__JSON__", json.dumps([{
+        html = fill_template(build_index_template(page_key, title), {
+            "DATA_SRC": write_data_script(f"{page_key}.js", "renderIndex", [{
                 "id": m["id"], "title": m["title"], "year": m["year"], "poster_url": m["poster_url"],
-                "overview": m.get("overview",""), "genres": m.get("genres", []),
+                "genres": m.get("genres", []), **card_html(m["title"], m.get("overview",""), m.get("genres")),
                 "href": m.get("href",""), "archived": bool(m.get("archived", False)),
-                "is_new": bool(m.get("is_new", False))
-            } for m in items], ensure_ascii=False))
-            .replace("__ACTIVE_COUNT__", str(len(active)))
-            .replace("__ARCH_COUNT__", str(len(archived)))
-            .replace("__TOTAL_COUNT__", str(len(active)+len(archived)))
-            .replace("__ACTIVE_SIZE__", format_size_lower(a))
-            .replace("__ARCH_SIZE__", format_size_lower(b))
-            .replace("__TOTAL_SIZE__", format_size_lower(t))
-        )
-        with open(os.path.join(site_dir, index_name), "w", encoding="utf-8") as f: f.write(html)
+                "is_new": bool(m.get("is_new", False)), "_lc": search_key(m["title"], m["year"])
+            } for m in items]),
+            "ACTIVE_COUNT": str(len(active)),
+            "ARCH_COUNT":   str(len(archived)),
+            "TOTAL_COUNT":  str(len(active)+len(archived)),
+            "ACTIVE_SIZE":  format_size_lower(a),
+            "ARCH_SIZE":    format_size_lower(b),
+            "TOTAL_SIZE":   format_size_lower(t),
+        })
+        write_with_gzip(os.path.join(site_dir, index_name), html.encode("utf-8"))
 
     render_movie_like("movies.html", "movies", "Movies", movies, movies_root)
     render_movie_like("standup.html", "standup", "Standup", standup, standup_root)
     render_movie_like("documentary.html", "docs", "Documentary", docs, docs_root)
 
-    shows_bytes = folder_size(shows_root, exclude_names={OUTPUT_DIR_NAME})
+    # Show/Season N/episode: a new episode only touches the season folder's mtime
+    shows_bytes = folder_size(shows_root, exclude_names={OUTPUT_DIR_NAME}, cache=size_cache, depth=2)
+    save_cache(size_cache_path, size_cache)
     episodes_count = sum(len(eps) for s in shows_meta.values() for eps in s["seasons"].values())
     shows_list_payload = []
     for sid, meta in shows_meta.items():
         shows_list_payload.append({
             "id": sid, "title": meta.get("title",""), "poster_url": meta.get("poster_url",""),
-            "overview": meta.get("overview",""), "first_year": meta.get("first_year"),
-            "genres": meta.get("genres", []), "href": f"/show?id={urllib.parse.quote(sid)}",
-            "is_new": sid in set(ordered_shows)
+            "first_year": meta.get("first_year"), "genres": meta.get("genres", []),
+            **card_html(meta.get("title",""), meta.get("overview",""), meta.get("genres")), "href": show_hrefs[sid],
+            "is_new": sid in new_show_ids, "_lc": search_key(meta.get("title",""))
         })
-    shows_tpl = build_index_template("shows", "Shows") \
-        .replace("__JSON__", json.dumps(shows_list_payload, ensure_ascii=False)) \
-        .replace("__SHOWS_COUNT__", str(len(shows_list_payload))) \
-        .replace("__EPISODES_COUNT__", str(episodes_count)) \
-        .replace("__SHOWS_SIZE__", format_size_lower(shows_bytes))
-    with open(os.path.join(site_dir, "shows.html"), "w", encoding="utf-8") as f: f.write(shows_tpl)
+    shows_tpl = fill_template(build_index_template("shows", "Shows"), {
+        "DATA_SRC":       write_data_script("shows.js", "renderIndex", shows_list_payload),
+        "SHOWS_COUNT":    str(len(shows_list_payload)),
+        "EPISODES_COUNT": str(episodes_count),
+        "SHOWS_SIZE":     format_size_lower(shows_bytes),
+    })
+    write_with_gzip(os.path.join(site_dir, "shows.html"), shows_tpl.encode("utf-8"))
 
     # Home ("New")
-    new_movies_payload = [{
-        "title": m["title"], "year": m["year"], "poster_url": m["poster_url"],
-        "overview": m.get("overview",""), "href": m.get("href","")
-    } for m in newest_movies]
-    new_stand_payload = [{
-        "title": m["title"], "year": m["year"], "poster_url": m["poster_url"],
-        "overview": m.get("overview",""), "href": m.get("href","")
-    } for m in newest_stand]
-    new_docs_payload = [{
-        "title": m["title"], "year": m["year"], "poster_url": m["poster_url"],
-        "overview": m.get("overview",""), "href": m.get("href","")
-    } for m in newest_docs]
-
-    home_html = HOME_TEMPLATE \
-        .replace("__NEW_MOVIES_JSON__", json.dumps(new_movies_payload, ensure_ascii=False)) \
-        .replace("__NEW_SHOWS_JSON__", json.dumps(new_shows_payload, ensure_ascii=False)) \
-        .replace("__NEW_STAND_JSON__", json.dumps(new_stand_payload, ensure_ascii=False)) \
-        .replace("__NEW_DOCS_JSON__", json.dumps(new_docs_payload, ensure_ascii=False)) \
-        .replace("__NEW_MOV_SIZE__", format_size_lower(new_movies_bytes)) \
-        .replace("__NEW_EPS_SIZE__", format_size_lower(new_shows_bytes))
-    with open(os.path.join(site_dir, "index.html"), "w", encoding="utf-8") as f: f.write(home_html)
+    home_html = fill_template(HOME_TEMPLATE, {
+        "DATA_SRC":     write_data_script("home.js", "renderHome", home_cards(newest_movies), new_shows_payload,
+                                          home_cards(newest_stand), home_cards(newest_docs)),
+        "NEW_MOV_SIZE": format_size_lower(new_movies_bytes),
+        "NEW_EPS_SIZE": format_size_lower(new_shows_bytes),
+    })
+    write_with_gzip(os.path.join(site_dir, "index.html"), home_html.encode("utf-8"))
 
     print(f"Built site at: {os.path.join(site_dir, 'index.html')} (Home) + movies.html + shows.html + standup.html + documentary.html")
     return site_dir
 
 # ====== SERVER ======
+_SITE_JSON = {}   # path -> ((mtime_ns, size), parsed); the handler only reads these objects
+
+def load_site_json(path):
+    """load_cache for the request path: the JSON is re-parsed only after a rebuild rewrote the file."""
+    try: st = os.stat(path)
+    except OSError: return {}
+    sig = (st.st_mtime_ns, st.st_size)
+    hit = _SITE_JSON.get(path)
+    if hit and hit[0] == sig: return hit[1]
+    obj = load_cache(path)
+    _SITE_JSON[path] = (sig, obj)
+    return obj
+
 class CinemaHandler(SimpleHTTPRequestHandler):
+    # keep-alive: every response carries Content-Length (send_file, the 302s, send_error, SimpleHTTPRequestHandler)
+    protocol_version = "HTTP/1.1"
+
     def __init__(self, *args, movies_root=None, shows_root=None, standup_root=None, docs_root=None, site_dir=None, **kwargs):
         self._movies_root  = movies_root
         self._shows_root   = shows_root
@@ -1265,180 +1850,132 @@ class CinemaHandler(SimpleHTTPRequestHandler):
         self._site_dir     = site_dir
         super().__init__(*args, directory=site_dir, **kwargs)
 
+    # posters are saved under their TMDB basename, which never changes for a given image
+    LONG_CACHE_PREFIXES = ("/posters/", "/posters_tv/")
+
+    def end_headers(self):
+        # ?v=<crc> URLs (static/, data/) get a new URL whenever their bytes change; pages and unversioned data revalidate
+        path = self.path.partition("?")[0]
+        if "?v=" in self.path:
+            self.send_header("Cache-Control", "public, max-age=31536000, immutable")
+        elif path.startswith(self.LONG_CACHE_PREFIXES):
+            self.send_header("Cache-Control", "public, max-age=31536000")
+        elif path in self.ROUTES or path.endswith(("/", ".html")) or path.startswith("/data/"):
+            self.send_header("Cache-Control", "no-cache")
+        super().end_headers()
+
+    # path (query stripped) -> handler; any other path is a static file under site_dir
+    ROUTES = {
+        "/movies":       lambda h: h.serve_file("movies.html"),
+        "/shows":        lambda h: h.serve_file("shows.html"),
+        "/standup":      lambda h: h.serve_file("standup.html"),
+        "/documentary":  lambda h: h.serve_file("documentary.html"),
+        "/movie":        lambda h: h.serve_detail(),
+        "/standup_item": lambda h: h.serve_detail(),
+        "/doc_item":     lambda h: h.serve_detail(),
+        "/show":         lambda h: h.serve_detail("Show not found"),
+        "/play_movie":   lambda h: h.launch_media("movies", "movies_index.json"),
+        "/play_standup": lambda h: h.launch_media("standup", "standup_index.json"),
+        "/play_doc":     lambda h: h.launch_media("docs", "docs_index.json"),
+        "/play_ep":      lambda h: h.launch_episode(),
+    }
+
+    GZIP_SUFFIXES = ("/", ".html", ".css", ".js")   # what build_site precompresses; posters have no .gz to look for
+
     def do_GET(self):
         p = self.path
-        if p == "/movies" or p.startswith("/movies?"): return self.serve_file("movies.html")
-        if p == "/shows" or p.startswith("/shows?"): return self.erve_file("shows.html") if False else self.serve_file("shows.html")
-        if p == "/standup" or p.startswith("/standup?"): return self.serve_file("standup.html")
-        if p == "/documentary" or p.startswith("/documentary?"): return self.serve_file("documentary.html")
-        if p.startswith("/movie"):        return self.render_media_page("movies", "movies_index.json", "movies_meta.json", "/play_movie?id=")
-        if p.startswith("/standup_item"): return self.render_media_page("standup", "standup_index.json", "standup_meta.json", "/play_standup?id=")
-        if p.startswith("/doc_item"):     return self.render_media_page("docs", "docs_index.json", "docs_meta.json", "/play_doc?id=")
-        if p.startswith("/play_movie?id="):   return self.launch_and_render("movies", "movies_index.json", "movies_meta.json")
-        if p.startswith("/play_standup?id="): return self.launch_and_render("standup", "standup_index.json", "standup_meta.json")
-        if p.startswith("/play_doc?id="):     return self.launch_and_render("docs", "docs_index.json", "docs_meta.json")
-        if p.startswith("/show"):         return self.render_show_page()
-        if p.startswith("/play_ep"):      return self.launch_episode()
+        path = p.partition("?")[0]
+        route = self.ROUTES.get(path)
+        if route: return route(self)
+        if path.endswith(self.GZIP_SUFFIXES) and accepts_gzip(self.headers.get("Accept-Encoding")):
+            fs = self.translate_path(p)
+            if os.path.isdir(fs): fs = os.path.join(fs, "index.html")
+            if self.serve_gzip(fs, self.guess_type(fs)): return
         return super().do_GET()
 
-    def serve_file(self, name):
-        p = os.path.join(self._site_dir, name)
-        if not os.path.isfile(p): self.send_error(404, "Not found"); return
-        with open(p, "rb") as f: data = f.read()
-        self.send_response(200)
-        self.send_header("Content-Type", "text/html; charset=utf-8" if name.endswith(".html") else "application/octet-stream")
-        self.end_headers()
-        self.wfile.write(data)
-
-    def render_media_page(self, active_key, idx_json, meta_json, play_prefix):
-        parsed = urllib.parse.urlparse(self.path)
-        qs = urllib.parse.parse_qs(parsed.query)
-        mid = qs.get("id", [""])[0]
-
-        mapping = load_cache(os.path.join(self._site_dir, idx_json))
-        meta_all = load_cache(os.path.join(self._site_dir, meta_json))
-
-        filepath = mapping.get(mid, "")
-        meta = meta_all.get(mid, {})
-        title = meta.get("title","Unknown Title")
-        year  = meta.get("year","")
-        poster_url = meta.get("poster_url","")
-        overview   = meta.get("overview","")
-        archived   = bool(meta.get("archived", False))
-        genres     = meta.get("genres",[])
-        runtime    = meta.get("runtime")
-        vote       = meta.get("vote")
-        cert       = meta.get("certification") or "NR"
-        cast       = meta.get("cast",[])
-        backdrop   = meta.get("backdrop_url","")
-        tagline    = meta.get("tagline","")
-
-        poster_html = f'<img src="{html_attr(poster_url)}" alt="Poster">' if poster_url else '<div style="width:100%;height:100%;display:flex;align-items:center;justify-content:center;color:#666;">No Poster</div>'
-        archived_badge = ' <span class="badge">ARCHIVED</span>' if archived else ''
-        genres_html = ", ".join(html_text(g) for g in genres) if genres else "—"
-        runtime_txt = minutes_to_hm(runtime) or "—"
-        vote_txt    = f"{vote:.1f}" if isinstance(vote,(int,float)) else "—"
-        tagline_txt = tagline or ""
-        subsep      = " • " if tagline_txt else ""
-        filename = os.path.basename(filepath) if filepath else "—"
-        filesize_txt = format_size_lower(safe_size(filepath)) if filepath and os.path.isfile(filepath) else "—"
-
-        page = detail_template(active_key) \
-            .replace("__TITLE__", html_text(title)) \
-            .replace("__YEAR__", html_text(str(year or ""))) \
-            .replace("__POSTER_HTML__", poster_html) \
-            .replace("__OVERVIEW__", html_text(overview or "")) \
-            .replace("__ARCHIVED_BADGE__", archived_badge) \
-            .replace("__GENRES__", genres_html or "—") \
-            .replace("__RUNTIME__", html_text(runtime_txt)) \
-            .replace("__VOTE__", html_text(vote_txt)) \
-            .replace("__CERT__", html_text(cert)) \
-            .replace("__TAGLINE__", html_text(tagline_txt)) \
-            .replace("__SUBSEP__", subsep) \
-            .replace("__BACKDROP__", html_attr(backdrop)) \
-            .replace("__FILENAME__", html_text(filename)) \
-            .replace("__FILESIZE__", html_text(filesize_txt)) \
-            .replace("__PLAY_HREF__", f"{play_prefix}{urllib.parse.quote(mid)}")
-
+    def not_modified(self, mtime):
+        # If-Modified-Since, checked the way SimpleHTTPRequestHandler.send_head does (whole seconds; If-None-Match wins)
+        ims = self.headers.get("If-Modified-Since")
+        if not ims or "If-None-Match" in self.headers: return False
+        try: since = email.utils.parsedate_to_datetime(ims)
+        except (TypeError, IndexError, OverflowError, ValueError): return False
+        if since.tzinfo is None: return False
+        return int(mtime) <= since.timestamp()
+
+    def send_file(self, f, ctype, encoding=None, mtime=None):
+        # mtime: the source file's (a .gz shares its page's validator); unchanged -> 304, no body
+        st = os.fstat(f.fileno())
+        mtime = st.st_mtime if mtime is None else mtime
+        if self.not_modified(mtime):
+            self.send_response(304)
+            self.send_header("Last-Modified", self.date_time_string(mtime))
+            self.send_header("Vary", "Accept-Encoding")
+            self.end_headers()
+            return
+        # socket.sendfile: os.sendfile (kernel copy, no userspace buffer) where available, chunked send() otherwise
         self.send_response(200)
-        self.send_header("Content-Type","text/html; charset=utf-8")
-        self.end_headers()
-        self.wfile.write(page.encode("utf-8"))
+        self.send_header("Content-Type", ctype)
+        if encoding: self.send_header("Content-Encoding", encoding)
+        self.send_header("Vary", "Accept-Encoding")   # same URL is sent gzipped or not
+        self.send_header("Content-Length", str(st.st_size))
+        self.send_header("Last-Modified", self.date_time_string(mtime))
+        self.end_headers()   # wfile is unbuffered, so the headers are already on the socket
+        self.connection.sendfile(f)
+
+    def serve_gzip(self, path, ctype):
+        # build_site writes a .gz next to each page/asset; callers have checked the client takes gzip
+        gz = path + ".gz"
+        try:
+            src_mtime = os.path.getmtime(path)
+            if os.path.getmtime(gz) < src_mtime: return False   # stale: source rewritten without it
+            f = open(gz, "rb")
+        except OSError:
+            return False
+        with f: self.send_file(f, ctype, "gzip", src_mtime)
+        return True
 
-    def launch_and_render(self, active_key, idx_json, meta_json):
-        parsed = urllib.parse.urlparse(self.path)
-        qs = urllib.parse.parse_qs(parsed.query)
-        mid = qs.get("id", [""])[0]
-        mapping = load_cache(os.path.join(self._site_dir, idx_json))
+    def serve_file(self, name, missing="Not found"):
+        p = os.path.join(self._site_dir, name)
+        if not os.path.isfile(p): self.send_error(404, missing); return
+        ctype = "text/html; charset=utf-8" if name.endswith(".html") else "application/octet-stream"
+        if accepts_gzip(self.headers.get("Accept-Encoding")) and self.serve_gzip(p, ctype): return
+        with open(p, "rb") as f: self.send_file(f, ctype)
+
+    def query_id(self):
+        # every route takes a single ?id=; same decoding as parse_qs without building its dict
+        for part in self.path.partition("?")[2].split("&"):
+            if part.startswith("id=") and part != "id=": return urllib.parse.unquote_plus(part[3:])
+        return ""
+
+    def serve_detail(self, missing="Not found"):
+        # /movie, /standup_item, /doc_item and /show?id=<id> -> pages/<id>.html written by build_site
+        pid = self.query_id()
+        if not pid.isalnum(): self.send_error(404, missing); return
+        return self.serve_file(os.path.join(PAGES_DIR, pid + ".html"), missing)
+
+    def launch_media(self, active_key, idx_json):
+        mid = self.query_id()
+        mapping = load_site_json(os.path.join(self._site_dir, idx_json))
         filepath = mapping.get(mid, "")
         if filepath and os.path.isfile(filepath):
             base = {"movies": self._movies_root, "standup": self._standup_root, "docs": self._docs_root}[active_key]
             self._launch(filepath, base_root=base)
+        # back to the (static) detail page, so a reload there doesn't relaunch the player
         path_prefix = {"movies": "/movie", "standup": "/standup_item", "docs": "/doc_item"}[active_key]
-        self.path = f"{path_prefix}?id={urllib.parse.quote(mid)}"
-        return self.render_media_page(active_key, idx_json, meta_json, f"/play_{'movie' if active_key=='movies' else 'standup' if active_key=='standup' else 'doc'}?id=")
-
-    # ----- Shows -----
-    def render_show_page(self):
-        parsed = urllib.parse.urlparse(self.path)
-        qs = urllib.parse.parse_qs(parsed.query)
-        sid = qs.get("id",[""])[0]
-
-        shows_meta = load_cache(os.path.join(self._site_dir, "shows_meta.json"))
-        meta = shows_meta.get(sid, {})
-        if not meta: self.send_error(404, "Show not found"); return
-
-        title = meta.get("title","Unknown Show")
-        poster_url = meta.get("poster_url","")
-        overview   = meta.get("overview","")
-        genres     = meta.get("genres",[])
-        vote       = meta.get("vote")
-        cast       = meta.get("cast",[])
-        backdrop   = meta.get("backdrop_url","")
-        tagline    = meta.get("tagline","")
-        first_year = meta.get("first_year")
-
-        poster_html = f'<img src="{html_attr(poster_url)}" alt="Poster">' if poster_url else '<div style="width:100%;height:100%;display:flex;align-items:center;justify-content:center;color:#666;">No Poster</div>'
-        genres_html = ", ".join(html_text(g) for g in genres) if genres else "—"
-        cast_html   = ", ".join(html_text(c) for c in cast) if cast else "—"
-        vote_txt    = f"{vote:.1f}" if isinstance(vote,(int,float)) else "—"
-        tagline_txt = tagline or ""
-        subsep      = " • " if tagline_txt else ""
-        fy_txt      = str(first_year) if first_year else ""
-
-        seasons = meta.get("seasons", {})
-        season_nums = sorted((int(k) for k in seasons.keys()))
-        blocks = []
-        for snum in season_nums:
-            s_key = str(snum)
-            eps = seasons.get(s_key, [])
-            items = []
-            for ep in eps:
-                label = f"S{snum:02d}E{ep['e']:02d}" + (f" — {html_text(ep.get('title',''))}" if ep.get("title") else "")
-                size_txt = format_size_lower(ep.get("size",0))
-                new_badge = '<span class="badge badge-new">NEW</span>' if ep.get("is_new") else ''
-                items.append(f"""
-                  <div class="ep">
-                    <div class="info"><div>{label}</div><div class="filesize">({size_txt})</div></div>
-                    <div style="display:flex; align-items:center; gap:8px;">
-                      {new_badge}
-                      <a class="btn" href="/play_ep?id={urllib.parse.quote(ep['eid'])}">
-                        <svg class="icon" viewBox="0 0 24 24" aria-hidden="true"><path d="M8 5v14l11-7z"/></svg>Play
-                      </a>
-                    </div>
-                  </div>
-                """)
-            blocks.append(f"<div class='season'><h2>Season {snum}</h2>{''.join(items)}</div>")
-        seasons_html = "\n".join(blocks) if blocks else "<div class='section'><div class='label'>No episodes found.</div></div>"
-
-        page = SHOW_PAGE_TEMPLATE \
-            .replace("__TITLE__", html_text(title)) \
-            .replace("__POSTER_HTML__", poster_html) \
-            .replace("__OVERVIEW__", html_text(overview or "")) \
-            .replace("__GENRES__", genres_html) \
-            .replace("__CAST__", cast_html) \
-            .replace("__VOTE__", vote_txt) \
-            .replace("__TAGLINE__", html_text(tagline_txt)) \
-            .replace("__FIRSTYEAR__", html_text(fy_txt)) \
-            .replace("__SUBSEP__", subsep) \
-            .replace("__SEASONS_HTML__", seasons_html) \
-            .replace("__BACKDROP__", html_attr(backdrop))
-
-        self.send_response(200)
-        self.send_header("Content-Type","text/html; charset=utf-8")
+        self.send_response(302)
+        self.send_header("Location", f"{path_prefix}?id={urllib.parse.quote(mid)}")
+        self.send_header("Content-Length", "0")
         self.end_headers()
-        self.wfile.write(page.encode("utf-8"))
 
     def launch_episode(self):
-        parsed = urllib.parse.urlparse(self.path)
-        qs = urllib.parse.parse_qs(parsed.query)
-        eid = qs.get("id",[""])[0]
-        idx = load_cache(os.path.join(self._site_dir, "episodes_index.json"))
+        eid = self.query_id()
+        idx = load_site_json(os.path.join(self._site_dir, "episodes_index.json"))
         filepath = idx.get(eid, "")
         if filepath and os.path.isfile(filepath):
             self._launch(filepath, base_root=self._shows_root)
             self.send_response(302)
             self.send_header("Location", self.headers.get("Referer", "/shows"))
+            self.send_header("Content-Length", "0")
             self.end_headers()
             return
         self.send_error(404, "Episode not found")
@@ -1461,7 +1998,7 @@ def serve_site(site_dir: str, movies_root: str, shows_root: str, standup_root: s
                       movies_root=movies_root, shows_root=shows_root,
                       standup_root=standup_root, docs_root=docs_root,
                       site_dir=site_dir)
-    httpd = HTTPServer(("127.0.0.1", port), handler)
+    httpd = ThreadingHTTPServer(("127.0.0.1", port), handler)   # a page's posters/scripts load in parallel
     print(f"Serving {site_dir} at http://127.0.0.1:{port}  (Ctrl+C to stop)")
     try: httpd.serve_forever()
     except KeyboardInterrupt: print("\nBye.")
@@ -1475,10 +2012,12 @@ def main():
     ap.add_argument("--port", type=int, default=8000, help="Port to serve on")
     ap.add_argument("--serve", action="store_true", help="Run local server after building")
     ap.add_argument("--quiet", action="store_true", help="Reduce TMDB logs")
+    ap.add_argument("--refresh-misses", action="store_true", help="Retry TMDB searches for titles cached as 'no match'")
     args = ap.parse_args()
 
-    global LOG_TMDB
+    global LOG_TMDB, REFRESH_MISSES
     LOG_TMDB = not args.quiet
+    REFRESH_MISSES = args.refresh_misses
 
     site_dir = build_site(args.movies_root, args.shows_root, args.standup_root, args.docs_root)
     if args.serve:
@@ -17,25 +17,39 @@ ALWAYS_TAKE_LAST_AS_UPLOADER = False
 
 # ---------- Normalization Helpers ----------
 
+# Compiled once; normalize_name runs for every entry in DIRECTORY
+YEAR_LETTER_RE    = re.compile(r'(\b(?:19|20)\d{2})([A-Za-z])')
+LETTER_QUALITY_RE = re.compile(r'([A-Za-z])(\d{3,4}p\b)', re.IGNORECASE)
+QUALITY_LETTER_RE = re.compile(r'(\d{3,4}p)([A-Za-z])', re.IGNORECASE)
+BLURAY_CODEC_RE   = re.compile(r'(BluRay)(x\d{3}|h\d{3}|HEVC|AV1|VP9)', re.IGNORECASE)
+WEBDL_CODEC_RE    = re.compile(r'(WEB[- ]?DL)(x\d{3}|h\d{3}|HEVC|AV1|VP9)', re.IGNORECASE)
+TOKEN_SPLIT_RE    = re.compile(r"[^\w§]+")
+YEAR_RE           = re.compile(r"(19\d{2}|20\d{2})")
+DOT_DASH_DOT_RE   = re.compile(r"\.-\.")
+DOTS_RE           = re.compile(r"\.+")
+
+# One-pass str.translate tables (each replaced a chain of .replace() calls)
+PUNCT_TABLE = str.maketrans({
+    "_": " ", ",": " ", "[": " ", "]": " ", "{": " ", "}": " ", ";": " ", "+": " ",
+    "–": "-", "—": "-", "·": " ",
+})
+PARENS_TABLE = str.maketrans("", "", "()")
+
 def clean_unicode(s: str) -> str:
-    s = unicodedata.normalize("NFKC", s)
-    s = s.replace("_", " ").replace(",", " ").replace("[", " ").replace("]", " ")
-    s = s.replace("{", " ").replace("}", " ").replace(";", " ").replace("+", " ")
-    s = s.replace("–", "-").replace("—", "-").replace("·", " ")
-    return s
+    return unicodedata.normalize("NFKC", s).translate(PUNCT_TABLE)
 
 def pre_split_fixes(name: str) -> str:
-    # Remove parentheses and normalize punctuation
-    name = name.replace("(", "").replace(")", "")
+    # Remove parentheses and normalize punctuation (parens go before NFKC, so "（" survives)
+    name = name.translate(PARENS_TABLE)
     name = clean_unicode(name)
 
     # Insert spaces at common glued boundaries (no lookbehinds)
-    name = re.sub(r'(\b(?:19|20)\d{2})([A-Za-z])', r'\1 \2', name)  # 2005Unrated -> 2005 Unrated
-    name = re.sub(r'([A-Za-z])(\d{3,4}p\b)', r'\1 \2', name, flags=re.IGNORECASE)  # Unrated1080p -> Unrated 1080p
-    name = re.sub(r'(\d{3,4}p)([A-Za-z])', r'\1 \2', name, flags=re.IGNORECASE)    # 1080pBluRay -> 1080p BluRay
+    name = YEAR_LETTER_RE.sub(r'\1 \2', name)  # 2005Unrated -> 2005 Unrated
+    name = LETTER_QUALITY_RE.sub(r'\1 \2', name)  # Unrated1080p -> Unrated 1080p
+    name = QUALITY_LETTER_RE.sub(r'\1 \2', name)    # 1080pBluRay -> 1080p BluRay
     # Jammed tokens like BluRayx264 -> BluRay x264 (extend as needed)
-    name = re.sub(r'(BluRay)(x\d{3}|h\d{3}|HEVC|AV1|VP9)', r'\1 \2', name, flags=re.IGNORECASE)
-    name = re.sub(r'(WEB[- ]?DL)(x\d{3}|h\d{3}|HEVC|AV1|VP9)', r'\1 \2', name, flags=re.IGNORECASE)
+    name = BLURAY_CODEC_RE.sub(r'\1 \2', name)
+    name = WEBDL_CODEC_RE.sub(r'\1 \2', name)
 
     return name
 
@@ -44,7 +58,7 @@ def tokenize(name: str):
     # Preserve hyphens by marking them temporarily
     name = name.replace("-", "§DASH§")
     # Split on any non-alnum/underscore/marker
-    parts = re.split(r"[^\w§]+", name)
+    parts = TOKEN_SPLIT_RE.split(name)
     tokens = [p for p in parts if p]
     # Restore hyphens
     tokens = [t.replace("§DASH§", "-") for t in tokens]
@@ -52,7 +66,7 @@ def tokenize(name: str):
 
 def find_year_index(tokens):
     for i, t in enumerate(tokens):
-        if re.fullmatch(r"(19\d{2}|20\d{2})", t):
+        if YEAR_RE.fullmatch(t):
             return i
     return None
 
@@ -69,22 +83,18 @@ HDR = {"hdr", "hdr10", "hdr10+", "dolby", "vision", "dv"}
 VIDEO = {"x264", "h264", "x265", "h265", "hevc", "xvid", "divx", "av1", "vp9"}
 AUDIO = {"aac", "ac3", "eac3", "ddp", "dd5", "dd5.1", "dts", "truehd", "flac", "opus", "mp3", "atmos"}
 
+# tag -> category in one lookup; built in the old check order so the first matching set still wins
+TAG_CATEGORY = {}
+for _cat, _tags in (("edition", EDITION), ("source", SOURCE), ("hdr", HDR), ("video", VIDEO), ("audio", AUDIO)):
+    for _t in _tags:
+        TAG_CATEGORY.setdefault(_t, _cat)
+
 def classify_token(token: str) -> str | None:
     """Return category name or None if not a known tag."""
     t = token.lower().lstrip("-")
     if QUALITY_RE.match(t):
         return "quality"
-    if t in EDITION:
-        return "edition"
-    if t in SOURCE:
-        return "source"
-    if t in HDR:
-        return "hdr"
-    if t in VIDEO:
-        return "video"
-    if t in AUDIO:
-        return "audio"
-    return None
+    return TAG_CATEGORY.get(t)
 
 def pick_quality(tokens):
     for i, t in enumerate(tokens):
@@ -146,8 +156,8 @@ def normalize_name(original_name: str) -> str:
     year_idx = find_year_index(tokens)
     if year_idx is None:
         base = ".".join(tokens)
-        base = re.sub(r"\.-\.", "-", base)
-        base = re.sub(r"\.+", ".", base).strip(".")
+        base = DOT_DASH_DOT_RE.sub("-", base)
+        base = DOTS_RE.sub(".", base).strip(".")
         return base
 
     title_tokens = tokens[:year_idx]
@@ -177,8 +187,8 @@ def normalize_name(original_name: str) -> str:
         parts.append(".".join(ordered_tags))
 
     base = ".".join(parts)
-    base = re.sub(r"\.-\.", "-", base)
-    base = re.sub(r"\.+", ".", base).strip(".")
+    base = DOT_DASH_DOT_RE.sub("-", base)
+    base = DOTS_RE.sub(".", base).strip(".")
 
     if uploader:
         base = base.rstrip(".")
@@ -186,45 +196,56 @@ def normalize_name(original_name: str) -> str:
 
     return base
 
-def unique_target_path(dirpath: str, target_name: str) -> str:
-    candidate = os.path.join(dirpath, target_name)
-    if not os.path.exists(candidate):
-        return candidate
-    n = 1
+def unique_target_path(dirpath: str, target_name: str, existing: set | None = None) -> str:
+    """First free path among target_name, target_name.1, ...
+
+    Names in `existing` (a snapshot of dirpath) are skipped without a stat; the
+    final pick is still checked on disk, which also catches case-insensitive matches.
+    """
+    if existing is None:
+        existing = set()
+    name, n = target_name, 0
     while True:
-        with_suffix = os.path.join(dirpath, f"{target_name}.{n}")
-        if not os.path.exists(with_suffix):
-            return with_suffix
+        if name not in existing:
+            candidate = os.path.join(dirpath, name)
+            if not os.path.exists(candidate):
+                return candidate
+            existing.add(name)
         n += 1
+        name = f"{target_name}.{n}"
 
 # ---------- File & Folder Processing ----------
 
-def process_folder(entry_path: str, entry_name: str):
+def process_folder(entry_path: str, entry_name: str, existing: set):
     new_name = normalize_name(entry_name)
     if not new_name or new_name == entry_name:
         return
-    new_path = unique_target_path(DIRECTORY, new_name)
+    new_path = unique_target_path(DIRECTORY, new_name, existing)
     print(f"Renaming folder:\n  {entry_name}\n→ {os.path.basename(new_path)}")
     if not DRY_RUN:
         try:
             os.rename(entry_path, new_path)
+            existing.discard(entry_name)
+            existing.add(os.path.basename(new_path))
         except OSError as e:
             print(f"  !! Failed: {e}")
 
-def process_file(entry_path: str, entry_name: str):
+def process_file(entry_path: str, entry_name: str, existing: set):
     # Build normalized folder name from the file's base name (no extension)
     base, ext = os.path.splitext(entry_name)
     folder_name = normalize_name(base)
     if not folder_name:
         folder_name = base  # fallback
 
-    target_dir = unique_target_path(DIRECTORY, folder_name)
+    target_dir = unique_target_path(DIRECTORY, folder_name, existing)
     print(f"Creating folder + moving file:\n  {entry_name}\n→ {os.path.basename(target_dir)}/")
     if not DRY_RUN:
         try:
             os.makedirs(target_dir, exist_ok=True)
+            existing.add(os.path.basename(target_dir))
             # Move file into the new folder (keep original file name)
             shutil.move(entry_path, os.path.join(target_dir, entry_name))
+            existing.discard(entry_name)
         except OSError as e:
             print(f"  !! Failed: {e}")
 
@@ -233,18 +254,20 @@ def main():
         print(f"Directory not found: {DIRECTORY}")
         return
 
-    entries = sorted(os.listdir(DIRECTORY))
-    for entry in entries:
+    # scandir's DirEntry carries the file type from readdir, so is_dir()/is_file() rarely need a stat
+    with os.scandir(DIRECTORY) as it:
+        entries = sorted(it, key=lambda e: e.name)
+    existing = {de.name for de in entries}  # kept in step with our own renames/moves
+    for de in entries:
+        entry = de.name
         if entry.startswith("."):
             continue  # skip hidden files like .DS_Store
 
-        entry_path = os.path.join(DIRECTORY, entry)
-
         try:
-            if os.path.isdir(entry_path):
-                process_folder(entry_path, entry)
-            elif os.path.isfile(entry_path):
-                process_file(entry_path, entry)
+            if de.is_dir():
+                process_folder(de.path, entry, existing)
+            elif de.is_file():
+                process_file(de.path, entry, existing)
         except Exception as e:
             print(f"!! Error handling '{entry}': {e}")
             traceback.print_exc()
@@ -1,9 +1,13 @@
 #!/usr/bin/env python3
-import os, re, argparse, sys, shutil
+import os, re, argparse, sys, shutil, functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator
 
 # ===== Defaults =====
 ROOT = "/Users/icemuppet/OTHER/SCN/0-INCOMING/SHOWS"   # scan + destination root by default
 VIDEO_EXTS = {".mkv",".mp4",".mov",".m4v",".avi",".ts",".m2ts",".wmv",".webm"}
+VIDEO_EXT_SUFFIXES = tuple(VIDEO_EXTS)   # for a single str.endswith check
+PLAN_WORKERS = 32   # threads planning a directory's files (realpath stats overlap)
 
 # Known tokens (normalized)
 QUALITY = {"2160P","1080P","720P","480P","540P"}
@@ -11,22 +15,43 @@ SOURCES = {"WEB-DL","WEB","BLURAY","BRRIP","HDTV","WEBDL","WEBRIP","DVDRIP","DSN
 VCODECS = {"X264","X265","H.264","H264","HEVC","XVID"}
 ACODECS = {"AAC","AC3","DDP5.1","DDP5.0","DDP5.2","EAC3","TRUEHD","DTS","PCM","FLAC"}
 
+# Normalized-uppercase buckets used when classifying tokens
+PROVIDER_TAGS = frozenset({"DSNP","AMZN","NF","HULU","MAX"})
+SOURCE_TAGS = frozenset({"WEB-DL","BLURAY","BRRIP","HDTV","DVDRIP"})
+AUDIO_TAGS = frozenset({"AAC","AC3","DDP5.1","EAC3","TRUEHD","DTS","FLAC"})
+VIDEO_TAGS = frozenset({"X264","X265","H.264","HEVC","XVID"})
+# Normalized-uppercase token -> classify_tokens group (the buckets are disjoint)
+TOKEN_GROUP = {tag: group for group, tags in (
+    ("quality", QUALITY), ("providers", PROVIDER_TAGS), ("sources", SOURCE_TAGS),
+    ("audio", AUDIO_TAGS), ("video", VIDEO_TAGS)) for tag in tags}
+TAIL_GROUPS = ("quality","providers","sources","audio","video")   # name tail order
+
 SxxEyy_RE = re.compile(r"\b[Ss]\s*(\d{1,2})\s*[.\-_ ]*[Ee]\s*(\d{1,2})\b")
 FALLBACK_RE = re.compile(r"^\s*(?P<show>.+?)\s*-\s*(?P<num>\d{3,4})(?:\s*-\s*(?P<title>.*?))?\s*$")
 
+# Brackets/underscores -> space in one pass; dot runs collapse and dots touching a dash drop
+SPACE_TRANS = str.maketrans({c: " " for c in "()[]{}_"})
+WS_RE = re.compile(r"\s+")
+NEEDS_NORM_RE = re.compile(r"[\s()\[\]{}_]")   # anything norm_spaces would change
+DOT_FIX_RE = re.compile(r"\.+-\.*|-\.+|\.{2,}")
+DASH_DOT_RE = re.compile(r"\.?-\.?")
+TOKEN_SEP_TRANS = str.maketrans("._", "  ")   # token separators are . _ and whitespace
+GROUP_SUFFIX_RE = re.compile(r"\s(-[A-Za-z0-9]+)\s*$")
+CANONICAL_RE = re.compile(r"\.[Ss]\d{2}[Ee]\d{2}\.")
+CANDIDATE_RE = re.compile(r"\d")   # SxxEyy and NNN/NNNN both need a digit; anything else can't parse
+
 def norm_spaces(s: str) -> str:
-    s = re.sub(r"[()\[\]{}]", " ", s)
-    s = s.replace("_"," ")
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
+    if not NEEDS_NORM_RE.search(s): return s   # already dot-separated release names
+    return WS_RE.sub(" ", s.translate(SPACE_TRANS)).strip()
 
+@functools.lru_cache(maxsize=4096)   # same show name comes through for every episode
 def dotify(s: str) -> str:
     s = norm_spaces(s).replace(" ", ".")
-    s = re.sub(r"\.{2,}", ".", s)
-    s = re.sub(r"\.-", "-", s)
-    s = re.sub(r"-\.", "-", s)
+    if ".." in s or ".-" in s or "-." in s:   # the only spots DOT_FIX_RE can touch
+        s = DOT_FIX_RE.sub(lambda m: "-" if "-" in m.group() else ".", s)
     return s.strip(".")
 
+@functools.lru_cache(maxsize=1024)
 def normalize_token(tok: str) -> str:
     t = tok.upper().replace(" ", "").replace("_","").replace("-", "")
     if t in {"WEB", "WEBDL", "WEBRIP"}: return "WEB-DL"
@@ -45,87 +70,74 @@ def normalize_token(tok: str) -> str:
     if t in QUALITY: return t
     return tok
 
-def split_tokens(text_after_ep: str):
-    raw = re.split(r"[.\s_]+", text_after_ep.strip())
-    toks = []
-    for r in raw:
-        if not r: continue
-        if r.startswith("-") and len(r) > 1:
-            toks.append(r); continue
-        toks.append(r)
-    return toks
-
-def classify_tokens(tokens):
+def split_tokens(text_after_ep: str) -> list[str]:
+    return text_after_ep.translate(TOKEN_SEP_TRANS).split()
+
+def classify_tokens(tokens: list[str]) -> tuple[dict[str, list[str]], str | None]:
     groups = {"quality":[], "providers":[], "sources":[], "audio":[], "video":[], "other":[]}
     group_suffix = None
     for tok in tokens:
         if tok.startswith("-") and len(tok) > 1:
             group_suffix = tok; continue
-        n = normalize_token(tok); u = n.upper()
-        if u in QUALITY:
-            groups["quality"].append(n)
-        elif u in {"DSNP","AMZN","NF","HULU","MAX"}:
-            groups["providers"].append(n)
-        elif u in {"WEB-DL","BLURAY","BRRIP","HDTV","DVDRIP"}:
-            groups["sources"].append("BluRay" if u in {"BLURAY","BRRIP"} else ("WEB-DL" if u=="WEB-DL" else n))
-        elif u in {"AAC","AC3","DDP5.1","EAC3","TRUEHD","DTS","FLAC"}:
-            groups["audio"].append(n)
-        elif u in {"X264","X265","H.264","HEVC","XVID"} or n in {"x264","x265","XviD"}:
-            groups["video"].append(n)
-        else:
-            groups["other"].append(tok)
+        n = normalize_token(tok)
+        g = TOKEN_GROUP.get(n.upper())
+        if g: groups[g].append(n)
+        else: groups["other"].append(tok)
     return groups, group_suffix
 
-def compose_name(show, season, episode, ep_title, groups, group_suffix, ext, fallback_used):
-    parts = [dotify(show), f"S{int(season):02d}E{int(episode):02d}"]
+# compose_name pieces either side of SxxEyy. The dash/dot cleanup never reaches
+# across that token (no dots or dashes in it), so each side is cleaned on its own
+# and memoized: the show half is shared by a whole series, the tail by episodes
+# that differ only in number.
+@functools.lru_cache(maxsize=4096)
+def name_head(show: str) -> str:
+    return DASH_DOT_RE.sub("-", f"{dotify(show)}.")
+
+@functools.lru_cache(maxsize=4096)
+def name_tail(ep_title: str, tags: tuple[str, ...], group_suffix: str | None, ext: str) -> str:
+    rest = ""
     if ep_title:
-        parts.append(dotify(ep_title))
+        rest += f".{dotify(ep_title)}"
+    if tags:
+        rest += "." + ".".join(tags)
+    rest = DASH_DOT_RE.sub("-", rest)
 
+    if group_suffix and group_suffix != "-":
+        rest = f"{rest}{group_suffix}"
+
+    return f"{rest}{ext}"
+
+def compose_name(show: str, season: int, episode: int, ep_title: str, groups: dict[str, list[str]],
+                 group_suffix: str | None, ext: str, fallback_used: bool) -> str:
     # If fallback used and no media tokens, add minimal guess for .avi
     if fallback_used:
-        have_media = any(groups[k] for k in ("quality","providers","sources","audio","video"))
+        have_media = any(groups[k] for k in TAIL_GROUPS)
         if ext.lower()==".avi" and not have_media:
             if "HDTV" not in groups["sources"]:
                 groups["sources"].append("HDTV")
             if "XviD" not in groups["video"]:
                 groups["video"].append("XviD")
 
-    def dedup(seq):
-        seen=set(); out=[]
-        for x in seq:
-            if x in seen: continue
-            seen.add(x); out.append(x)
-        return out
-
-    tail = []
-    tail += dedup(groups["quality"])
-    tail += dedup(groups["providers"])
-    tail += dedup(groups["sources"])
-    tail += dedup(groups["audio"])
-    tail += dedup(groups["video"])
-    if tail:
-        parts.append(".".join(tail))
-
-    base = ".".join(parts)
-    base = re.sub(r"\.-", "-", base)
-    base = re.sub(r"-\.", "-", base)
-
-    if group_suffix and group_suffix != "-":
-        base = f"{base}{group_suffix}"
-
-    return f"{base}{ext}"
+    # Groups never share a value, so one ordered dedup over all of them == per-group dedup
+    tags = tuple(dict.fromkeys(x for k in TAIL_GROUPS for x in groups[k]))
+    return f"{name_head(show)}S{int(season):02d}E{int(episode):02d}{name_tail(ep_title, tags, group_suffix, ext)}"
 
 def already_canonical(name: str) -> bool:
-    return bool(re.search(r"\.[Ss]\d{2}[Ee]\d{2}\.", f".{name}."))
+    return bool(CANONICAL_RE.search(f".{name}."))
 
-def parse_standard(base_no_ext: str):
+# Normalized name with any trailing " -GROUP" cut off, plus that suffix
+def split_group_suffix(base_no_ext: str) -> tuple[str, str | None]:
     s = norm_spaces(base_no_ext)
-    group_suffix = None
-    m_group = re.search(r"\s(-[A-Za-z0-9]+)\s*$", s)
+    m_group = GROUP_SUFFIX_RE.search(s)
     if m_group:
-        group_suffix = m_group.group(1)
-        s = s[:m_group.start()].rstrip()
+        return s[:m_group.start()].rstrip(), m_group.group(1)
+    return s, None
+
+def parse_standard(base_no_ext: str, prepared: tuple[str, str | None] | None = None) -> dict | None:
+    s, group_suffix = prepared or split_group_suffix(base_no_ext)
 
+    # SxxEyy needs both letters; fallback-style names usually lack one, so skip the regex
+    if ("S" not in s and "s" not in s) or ("E" not in s and "e" not in s): return None
     m = SxxEyy_RE.search(s)
     if not m: return None
     season = int(m.group(1)); episode = int(m.group(2))
@@ -136,15 +148,7 @@ def parse_standard(base_no_ext: str):
     title_tokens = []; trailing=[]
     hit_meta=False
     for t in tokens:
-        n = normalize_token(t); u = n.upper()
-        is_meta = (
-            u in QUALITY or
-            u in {"WEB-DL","BLURAY","BRRIP","HDTV","DVDRIP"} or
-            u in {"DSNP","AMZN","NF","HULU","MAX"} or
-            u in {"AAC","AC3","DDP5.1","EAC3","TRUEHD","DTS","FLAC"} or
-            u in {"X264","X265","H.264","HEVC","XVID"} or
-            t.startswith("-")
-        )
+        is_meta = normalize_token(t).upper() in TOKEN_GROUP or t.startswith("-")
         if not hit_meta and not is_meta:
             title_tokens.append(t)
         else:
@@ -159,13 +163,8 @@ def parse_standard(base_no_ext: str):
         "groups": groups, "group_suffix": suffix, "fallback_used": False
     }
 
-def parse_fallback(base_no_ext: str):
-    s = norm_spaces(base_no_ext)
-    group_suffix = None
-    m_group = re.search(r"\s(-[A-Za-z0-9]+)\s*$", s)
-    if m_group:
-        group_suffix = m_group.group(1)
-        s = s[:m_group.start()].rstrip()
+def parse_fallback(base_no_ext: str, prepared: tuple[str, str | None] | None = None) -> dict | None:
+    s, group_suffix = prepared or split_group_suffix(base_no_ext)
 
     m = FALLBACK_RE.match(s)
     if not m: return None
@@ -186,7 +185,7 @@ def parse_fallback(base_no_ext: str):
         "groups": groups, "group_suffix": group_suffix, "fallback_used": True
     }
 
-def plan_destination(root_dest: str, info: dict, ext: str, original_fn: str):
+def plan_destination(root_dest: str, info: dict, ext: str, original_fn: str) -> tuple[str, str]:
     show_folder = dotify(info["show"])
     season_folder = f"S{int(info['season']):02d}"
     dest_dir = os.path.join(root_dest, show_folder, season_folder)
@@ -196,59 +195,132 @@ def plan_destination(root_dest: str, info: dict, ext: str, original_fn: str):
     )
     return dest_dir, new_filename
 
-def ensure_unique(path: str):
+# listings: optional {dir: set of names} cache; on a collision the dir is listed once
+# and taken names are skipped without a syscall (the final pick is still checked on disk)
+def ensure_unique(path: str, listings: dict[str, set[str]] | None = None) -> str:
     if not os.path.exists(path): return path
     base, ext = os.path.splitext(path); i=1
+    names = None
+    if listings is not None:
+        d = os.path.dirname(path)
+        names = listings.get(d)
+        if names is None:
+            try:
+                with os.scandir(d or ".") as it:
+                    names = listings[d] = {e.name for e in it}
+            except OSError:
+                names = None
     while True:
         cand = f"{base}._{i}{ext}"
-        if not os.path.exists(cand): return cand
+        if (names is None or os.path.basename(cand) not in names) and not os.path.exists(cand):
+            return cand
         i += 1
 
-def plan(path: str, dest_root: str):
+# path is a video file: walk_videos has already filtered on the extension
+def plan(path: str, dest_root: str) -> dict | None:
     d, fn = os.path.dirname(path), os.path.basename(path)
     base, ext = os.path.splitext(fn)
-    if ext.lower() not in VIDEO_EXTS: return None
 
-    # Parse
-    parsed = parse_standard(base) or parse_fallback(base)
+    # Parse (both parsers share one normalize + group-suffix pass)
+    if not CANDIDATE_RE.search(base): return None
+    prepared = split_group_suffix(base)
+    parsed = parse_standard(base, prepared) or parse_fallback(base, prepared)
     if not parsed: return None
 
     # Destination
     dest_dir, new_name = plan_destination(dest_root, parsed, ext, fn)
     dest_path = os.path.join(dest_dir, new_name)
 
-    # Skip if already perfect (filename + location)
-    if os.path.realpath(os.path.join(d, fn)) == os.path.realpath(dest_path):
+    # Skip if already perfect (filename + location); realpath only when the strings differ
+    src = os.path.join(d, fn)
+    if os.path.normpath(src) == os.path.normpath(dest_path):
+        return None
+    if os.path.realpath(src) == os.path.realpath(dest_path):
         return None
 
     return {
-        "src": os.path.join(d, fn),
+        "src": src,
         "dest_dir": dest_dir,
         "dest": dest_path
     }
 
-def scan_move_and_rename(scan_root: str, dest_root: str, dry_run: bool):
+# Top-down like os.walk (a dir is listed in full before its files are handed out),
+# yielding (dirpath, file count, video filenames); symlinked dirs are not followed
+def walk_videos(top: str) -> Iterator[tuple[str, int, list[str]]]:
+    try:
+        with os.scandir(top) as it:
+            entries = list(it)
+    except OSError:
+        return
+    subdirs = []; nfiles = 0; videos = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if is_dir:
+            if not entry.is_symlink(): subdirs.append(entry.path)
+            continue
+        nfiles += 1
+        if entry.name.lower().endswith(VIDEO_EXT_SUFFIXES):
+            videos.append(entry.name)
+    yield top, nfiles, videos
+    for sub in subdirs:
+        yield from walk_videos(sub)
+
+# One rename syscall when both roots share a device; anything odd goes through shutil.move
+def move_file(src: str, dst: str, same_dev: bool) -> None:
+    if same_dev:
+        try:
+            os.replace(src, dst); return
+        except OSError:
+            pass   # e.g. a mount point inside the tree; let shutil.move copy or report it
+    shutil.move(src, dst)
+
+def same_device(a: str, b: str) -> bool:
+    try:
+        return os.stat(a).st_dev == os.stat(b).st_dev
+    except OSError:
+        return False
+
+def scan_move_and_rename(scan_root: str, dest_root: str, dry_run: bool) -> None:
     checked = 0; moved = 0
-    for dirpath, _, filenames in os.walk(scan_root):
-        for fname in filenames:
-            checked += 1
-            src = os.path.join(dirpath, fname)
-            p = plan(src, dest_root)
-            if not p: continue
-            os.makedirs(p["dest_dir"], exist_ok=True)
-            dst = ensure_unique(p["dest"])
-            rel_src = os.path.relpath(src, scan_root)
-            rel_dst = os.path.relpath(dst, dest_root)
-            print(f"[MOVE] {rel_src}  ->  {rel_dst}")
-            if not dry_run:
-                try:
-                    shutil.move(src, dst)
-                    moved += 1
-                except Exception as e:
-                    print(f"   !! Failed to move: {e}", file=sys.stderr)
+    same_dev = not dry_run and same_device(scan_root, dest_root)
+    out = []            # [MOVE] lines, written once per directory (or before an error)
+    def flush():
+        if out: sys.stdout.write("".join(out)); out.clear()
+    made_dirs = set()   # dest dirs already ensured this run
+    listings = {}       # dest dir -> names, for ensure_unique; kept in step with our moves
+    # Plans for a directory are worked out in parallel; moves stay serial and in listing order
+    try:
+        with ThreadPoolExecutor(max_workers=PLAN_WORKERS) as ex:
+            for dirpath, nfiles, filenames in walk_videos(scan_root):
+                checked += nfiles
+                srcs = [os.path.join(dirpath, fname) for fname in filenames]
+                for src, p in zip(srcs, ex.map(lambda src: plan(src, dest_root), srcs)):
+                    if not p: continue
+                    if p["dest_dir"] not in made_dirs:
+                        os.makedirs(p["dest_dir"], exist_ok=True)
+                        made_dirs.add(p["dest_dir"])
+                    dst = ensure_unique(p["dest"], listings)
+                    rel_src = os.path.relpath(src, scan_root)
+                    rel_dst = os.path.relpath(dst, dest_root)
+                    out.append(f"[MOVE] {rel_src}  ->  {rel_dst}\n")
+                    if not dry_run:
+                        try:
+                            move_file(src, dst, same_dev)
+                            moved += 1
+                            listings.get(os.path.dirname(src), set()).discard(os.path.basename(src))
+                            listings.get(os.path.dirname(dst), set()).add(os.path.basename(dst))
+                        except Exception as e:
+                            flush(); sys.stdout.flush()
+                            print(f"   !! Failed to move: {e}", file=sys.stderr)
+                flush()
+    finally:
+        flush()
     print(f"\nDone. Checked {checked} files. Moved/Renamed {moved}.\n")
 
-def main():
+def main() -> None:
     ap = argparse.ArgumentParser(description="Rename and organize TV files into SHOWS/Show.Name/Sxx/")
     ap.add_argument("--root", default=ROOT, help="Scan root (default also used as destination root)")
     ap.add_argument("--dest-root", default=None, help="Destination root (defaults to --root)")